@@ -8,6 +8,9 @@ from lxml import etree
 from typing import Optional
 import os
 
+PODCAST_NS = 'https://podcastindex.org/namespace/1.0'
+_PODCAST_CHAPTERS_TAG = f'{{{PODCAST_NS}}}chapters'
+
 
 class BaseFeed:
     """Base class for all feed operations."""
@@ -24,21 +27,24 @@ class BaseFeed:
         self.channel: Optional[etree._Element] = None
         self.source_latest_pubdate: Optional[str] = None
         self.source_latest_link: Optional[str] = None
+        # Root the podcast namespace was last ensured on (see _ensure_podcast_namespace)
+        self._podcast_ns_root: Optional[etree._Element] = None
 
     def fetch_feed(self) -> None:
         """Fetch and parse RSS feed from source URL or local file."""
-        # Check if source is a local file path
+        # Check if source is a local file path. Either way libxml2 parses straight
+        # from the file or socket, without buffering the whole document first.
         if os.path.isfile(self.source_url):
             print(f"Loading feed from local file: {self.source_url}")
-            with open(self.source_url, 'rb') as f:
-                content = f.read()
+            self.root = etree.parse(self.source_url).getroot()
         else:
             print(f"Fetching feed: {self.source_url}")
-            response = requests.get(self.source_url, timeout=30)
-            response.raise_for_status()
-            content = response.content
+            with requests.get(self.source_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip/deflate transfer encoding while reading
+                response.raw.decode_content = True
+                self.root = etree.parse(response.raw).getroot()
 
-        self.root = etree.fromstring(content)
         self.channel = self.root.find('channel')
 
         if self.channel is None:
@@ -50,13 +56,13 @@ class BaseFeed:
         if items:
             first_item = items[0]
 
-            first_pubdate = first_item.find('pubDate')
-            if first_pubdate is not None and first_pubdate.text:
-                self.source_latest_pubdate = first_pubdate.text.strip()
+            first_pubdate = first_item.findtext('pubDate')
+            if first_pubdate:
+                self.source_latest_pubdate = first_pubdate.strip()
 
-            first_link = first_item.find('link')
-            if first_link is not None and first_link.text:
-                self.source_latest_link = first_link.text.strip()
+            first_link = first_item.findtext('link')
+            if first_link:
+                self.source_latest_link = first_link.strip()
 
         print(f"Found {len(items)} episodes")
         if self.source_latest_pubdate:
@@ -66,12 +72,16 @@ class BaseFeed:
         self._format_existing_chapters(items)
 
 
-    def write_feed(self, output_file: str) -> None:
+    def write_feed(self, output_file: str, compression: int = 0) -> None:
         """
         Write feed to file.
 
+        The tree is serialized straight into the file by libxml2, so no
+        intermediate byte string of the whole feed is built in memory.
+
         Args:
             output_file: Output file path
+            compression: gzip compression level (0-9); 0 writes plain XML
         """
         if self.root is None:
             raise ValueError("No feed loaded")
@@ -81,7 +91,8 @@ class BaseFeed:
             output_file,
             encoding='utf-8',
             xml_declaration=True,
-            pretty_print=True
+            pretty_print=True,
+            compression=compression
         )
 
         print(f"✓ Feed written to: {output_file}")
@@ -95,7 +106,7 @@ class BaseFeed:
         """
         for item in items:
             # Find podcast:chapters element
-            chapters = item.find('{https://podcastindex.org/namespace/1.0}chapters')
+            chapters = item.find(_PODCAST_CHAPTERS_TAG)
             if chapters is not None:
                 self._add_newline_before_element(item, chapters)
 
@@ -107,23 +118,26 @@ class BaseFeed:
             parent: Parent element
             element: Element to add newline before
         """
-        children = list(parent)
-        idx = children.index(element)
-        if idx > 0:
-            prev_elem = children[idx - 1]
+        prev_elem = element.getprevious()
+        if prev_elem is not None:
             prev_elem.tail = '\n        '
 
     def _ensure_podcast_namespace(self) -> None:
         """Ensure podcast namespace is registered in root element."""
-        nsmap = self.root.nsmap.copy()
+        # Nothing to do until the root is replaced (fetch_feed, prune_unused_namespaces)
+        if self._podcast_ns_root is self.root:
+            return
+
+        nsmap = self.root.nsmap
         if 'podcast' not in nsmap:
-            nsmap['podcast'] = 'https://podcastindex.org/namespace/1.0'
+            nsmap['podcast'] = PODCAST_NS
             # Recreate root with new nsmap
             new_root = etree.Element(self.root.tag, attrib=self.root.attrib, nsmap=nsmap)
             for child in self.root:
                 new_root.append(child)
             self.root = new_root
             self.channel = self.root.find('channel')
+        self._podcast_ns_root = self.root
 
     def prune_unused_namespaces(self) -> 'BaseFeed':
         """
@@ -3,26 +3,351 @@ Feed Enricher - Add Podcasting 2.0 tags to existing feeds.
 Preserves all original content while adding new metadata.
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache, partial
+from html.parser import HTMLParser
+from itertools import pairwise
 from lxml import etree
-from typing import List, Dict, Optional
+from operator import itemgetter
+from typing import List, Dict, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
+import copy
 import json
 import os
+import re
 import shutil
 import string
 from urllib.parse import urlparse
 from src.common.base_feed import BaseFeed
 
+PODCAST_NS = 'https://podcastindex.org/namespace/1.0'
+ITUNES_NS = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
+PSC_NS = 'http://podlove.org/simple-chapters'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+
+# Precompiled child lookups for the per-item loops (compiled once at import
+# instead of resolving the path on every find() call)
+_XPATH_NS = {'podcast': PODCAST_NS, 'itunes': ITUNES_NS, 'psc': PSC_NS}
+_FIND_PODCAST_CHAPTERS = etree.XPath('podcast:chapters', namespaces=_XPATH_NS)
+_FIND_PSC_CHAPTERS = etree.XPath('psc:chapters', namespaces=_XPATH_NS)
+_FIND_PSC_CHAPTER_LIST = etree.XPath('psc:chapter', namespaces=_XPATH_NS)
+_FIND_ITUNES_EPISODE = etree.XPath('itunes:episode', namespaces=_XPATH_NS)
+_FIND_ITUNES_EPISODE_TYPE = etree.XPath('itunes:episodeType', namespaces=_XPATH_NS)
+_FIND_ITUNES_TITLE = etree.XPath('itunes:title', namespaces=_XPATH_NS)
+
+# Clark-notation tag names, built once instead of per element/lookup
+_PERSON_TAG = f'{{{PODCAST_NS}}}person'
+_SEASON_TAG = f'{{{PODCAST_NS}}}season'
+_EPISODE_TAG = f'{{{PODCAST_NS}}}episode'
+_GUID_TAG = f'{{{PODCAST_NS}}}guid'
+_FUNDING_TAG = f'{{{PODCAST_NS}}}funding'
+_MEDIUM_TAG = f'{{{PODCAST_NS}}}medium'
+_PODROLL_TAG = f'{{{PODCAST_NS}}}podroll'
+_REMOTE_ITEM_TAG = f'{{{PODCAST_NS}}}remoteItem'
+_SOCIAL_INTERACT_TAG = f'{{{PODCAST_NS}}}socialInteract'
+_UPDATE_FREQUENCY_TAG = f'{{{PODCAST_NS}}}updateFrequency'
+_TRANSCRIPT_TAG = f'{{{PODCAST_NS}}}transcript'
+_ITUNES_EPISODE_TAG = f'{{{ITUNES_NS}}}episode'
+_ITUNES_IMAGE_TAG = f'{{{ITUNES_NS}}}image'
+_ITUNES_SEASON_TAG = f'{{{ITUNES_NS}}}season'
+_ITUNES_SUMMARY_TAG = f'{{{ITUNES_NS}}}summary'
+_ITUNES_TITLE_TAG = f'{{{ITUNES_NS}}}title'
+_CONTENT_ENCODED_TAG = f'{{{CONTENT_NS}}}encoded'
+_ATOM_LINK_TAG = f'{{{ATOM_NS}}}link'
+_PODCAST_CHAPTERS_TAG = f'{{{PODCAST_NS}}}chapters'
+_PSC_CHAPTERS_TAG = f'{{{PSC_NS}}}chapters'
+_PSC_CHAPTER_TAG = f'{{{PSC_NS}}}chapter'
+_ITUNES_NS_PREFIX = f'{{{ITUNES_NS}}}'
+_ITEM_PODCAST_CHAPTERS_PATH = f'item/{_PODCAST_CHAPTERS_TAG}'
+_ITEM_PSC_CHAPTERS_PATH = f'item/{_PSC_CHAPTERS_TAG}'
+
+# Podcasting 2.0 tags this enricher adds, checked by validate_no_conflicts()
+_CHANNEL_CONFLICT_TAGS = [
+    'guid', 'funding', 'medium', 'updateFrequency',
+    'podroll', 'socialInteract', 'person'
+]
+_ITEM_CONFLICT_TAGS = ['season', 'episode', 'person']
+# Clark tag -> conflict tag name, for the child-walking variants
+_CHANNEL_CONFLICT_CLARK = {f'{{{PODCAST_NS}}}{tag}': tag for tag in _CHANNEL_CONFLICT_TAGS}
+_ITEM_CONFLICT_CLARK = {f'{{{PODCAST_NS}}}{tag}': tag for tag in _ITEM_CONFLICT_TAGS}
+_FIND_CHANNEL_CONFLICTS = etree.XPath(
+    ' | '.join(f'podcast:{tag}' for tag in _CHANNEL_CONFLICT_TAGS), namespaces=_XPATH_NS
+)
+_FIND_ITEM_CONFLICTS = etree.XPath(
+    ' | '.join(f'item/podcast:{tag}' for tag in _ITEM_CONFLICT_TAGS), namespaces=_XPATH_NS
+)
+
+# Guest-title parsing: trailing episode number and " og " between guest names
+_EPISODE_NUMBER_RE = re.compile(r'\s*\(#?\d+\)$')
+_OG_SPLIT_RE = re.compile(r'\s+og\s+', re.IGNORECASE)
+_LITERAL_PREFIX_RE = re.compile(r'[A-Za-z0-9 ]*')
+
+# "Kommentarer fra ..." chapters about social media or the previous episode (handled earlier)
+_KOMMENTARER_SKIP_WORDS = ('sosiale medier', 'forrige', 'sist', 'facebook', 'twitter', 'bluesky')
+
+# Translation table deleting ASCII punctuation (see _normalize_words)
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+
+# Norwegian timezone (+0100) used for generated timestamps, matching pubDate
+# regardless of where the script runs
+NORWAY_TZ = timezone(timedelta(hours=1))
+
+# Number of concurrent chapter JSON downloads
+_FETCH_WORKERS = 16
+
+# OP3 (Open Podcast Prefix Project) analytics prefix for enclosure URLs
+OP3_PREFIX = "https://op3.dev/e/"
+
+
+def _first(matches: list) -> Optional[etree._Element]:
+    """Return the first element of an XPath result list, or None."""
+    return matches[0] if matches else None
+
+
+def _title_and_guid(item: etree._Element) -> tuple:
+    """
+    Return the first <title> and <guid> children of an item in one child walk.
+
+    Either element is None when missing.
+    """
+    title_elem = guid_elem = None
+    for child in item:
+        tag = child.tag
+        if tag == 'title':
+            if title_elem is None:
+                title_elem = child
+                if guid_elem is not None:
+                    break
+        elif tag == 'guid':
+            if guid_elem is None:
+                guid_elem = child
+                if title_elem is not None:
+                    break
+    return title_elem, guid_elem
+
+
+def _fetch_json(session: requests.Session, url: str, timeout: int = 10):
+    """Fetch and decode a JSON document, returning None on any failure."""
+    try:
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        # json.loads detects the UTF encoding of raw bytes itself
+        return json.loads(response.content)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _compile_ci(pattern: str) -> re.Pattern:
+    """Compile a case-insensitive regex, cached per pattern string."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _literal_prefix(pattern: str) -> str:
+    """
+    Return the lowercased literal text every match of pattern must start with.
+
+    Only plain letters, digits and spaces at the very start of the pattern are
+    taken, and only when the pattern has no top-level alternation; a character
+    followed by a quantifier is dropped. Returns '' when no safe prefix exists.
+    """
+    prefix = _LITERAL_PREFIX_RE.match(pattern).group(0)
+    if not prefix:
+        return ''
+
+    # A '|' outside any group or character class makes the prefix optional
+    depth = 0
+    in_class = escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return ''
+
+    if pattern[len(prefix):len(prefix) + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]
+    return prefix.lower()
+
+
+@lru_cache(maxsize=64)
+def _get_season_name(season_num: int) -> str:
+    """Generate season name from number (S1 = Vår 2020, S2 = Høst 2020, etc.)."""
+    if season_num <= 0:
+        return f"Sesong {season_num}"
+
+    # Calculate year and season (odd seasons are spring)
+    year = 2020 + (season_num - 1) // 2
+    is_spring = season_num & 1
+
+    season_name = "Vår" if is_spring else "Høst"
+    return f"{season_name} {year}"
+
+
+def _normalize_words(text: str) -> set:
+    """Remove punctuation and split into words for fuzzy matching."""
+    clean_text = text.translate(_PUNCTUATION_TABLE)
+    return set(clean_text.lower().split())
+
+
+def _build_suffix_trie(titles_to_covers: Dict[str, str]) -> Dict:
+    """
+    Index episode names by their reversed characters for chapter suffix matching.
+
+    Names of 3 characters or less are skipped. A leading "the " is dropped when
+    at least two words remain, as in the linear suffix scan this replaces. Each
+    terminal node (key '') keeps the cover of the earliest name in
+    titles_to_covers order.
+    """
+    trie = {}
+    for index, (episode_name, cover) in enumerate(titles_to_covers.items()):
+        if len(episode_name) <= 3:
+            continue
+
+        episode_normalized = episode_name
+        if episode_normalized.startswith("the "):
+            without_the = episode_normalized[4:]
+            if ' ' in without_the:  # Must have at least 2 words after removing "the"
+                episode_normalized = without_the
+
+        node = trie
+        for char in reversed(episode_normalized):
+            node = node.setdefault(char, {})
+        node.setdefault('', (index, cover))
+    return trie
+
+
+def _match_suffix(trie: Dict, text: str) -> Optional[str]:
+    """
+    Return the cover of the earliest indexed name that text ends with, or None.
+
+    Walks text backwards through a trie from _build_suffix_trie(), so the cost
+    is bounded by len(text) instead of the number of episode names.
+    """
+    best = None
+    node = trie
+    for char in reversed(text):
+        node = node.get(char)
+        if node is None:
+            break
+        terminal = node.get('')
+        if terminal is not None and (best is None or terminal[0] < best[0]):
+            best = terminal
+    return best[1] if best is not None else None
+
+
+def _best_word_match(words: set, ctx: Dict, accept) -> Optional[str]:
+    """
+    Return the cover of the episode name sharing the most words with words.
+
+    Only names for which accept(overlap) is true count; ties go to the earliest
+    name in feed order. Scores are summed over the posting lists of
+    ctx['cover_word_index'], so names without a shared word are never visited.
+    """
+    overlaps = Counter(
+        position
+        for word in words
+        for position in ctx['cover_word_index'].get(word, ())
+    )
+
+    best_match = None
+    best_match_score = 0
+    for position in sorted(overlaps):
+        match_score = overlaps[position]
+        if accept(match_score) and match_score > best_match_score:
+            best_match = ctx['cover_words'][position][1]
+            best_match_score = match_score
+    return best_match
+
+
+def _is_itunes(elem: etree._Element) -> bool:
+    """True for itunes:* elements (comments and PIs have non-str tags)."""
+    return isinstance(elem.tag, str) and elem.tag.startswith(_ITUNES_NS_PREFIX)
+
+
+class _ParagraphExtractor(HTMLParser):
+    """Collect the text of each non-empty <p> element of an HTML snippet."""
+
+    # Named entity references decoded inside paragraphs
+    ENTITIES = {
+        'aring': 'å', 'oslash': 'ø', 'aelig': 'æ',
+        'Aring': 'Å', 'Oslash': 'Ø', 'Aelig': 'Æ',
+        'amp': '&', 'nbsp': ' ',
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.paragraphs = []
+        self.current_text = ''
+        self.in_p = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'p':
+            self.in_p = True
+            self.current_text = ''
+
+    def handle_endtag(self, tag):
+        if tag == 'p' and self.in_p:
+            text = self.current_text.strip()
+            if text:
+                self.paragraphs.append(text)
+            self.in_p = False
+
+    def handle_data(self, data):
+        if self.in_p:
+            self.current_text += data
+
+    def handle_entityref(self, name):
+        char = self.ENTITIES.get(name, f'&{name};')
+        if self.in_p:
+            self.current_text += char
+
 
 class FeedEnricher(BaseFeed):
     """Enrich podcast feeds with Podcasting 2.0 tags."""
 
-    def validate_no_conflicts(self) -> 'FeedEnricher':
+    def __init__(self, source_url: str):
+        """
+        Initialize feed enricher.
+
+        Args:
+            source_url: URL of RSS feed to process
+        """
+        super().__init__(source_url)
+        # Title elements that already have their episode number restored
+        self._restored_titles = set()
+        # Pooled HTTP session so concurrent chapter downloads reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_FETCH_WORKERS, pool_maxsize=_FETCH_WORKERS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def validate_no_conflicts(self, fast_fail: bool = False) -> 'FeedEnricher':
         """
         Validate that the source feed doesn't already contain Podcasting 2.0 tags
         that this enricher will add. This prevents silent conflicts when the
         original feed starts supporting these tags.
 
+        Args:
+            fast_fail: If True, stop at the first conflicting tag instead of
+                       counting all of them (the error then names only that tag)
+
         Raises:
             ValueError: If any conflicting tags are found
 
@@ -32,38 +357,124 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        PODCAST_NS = 'https://podcastindex.org/namespace/1.0'
+        if fast_fail:
+            self._check_first_conflict()
+            print("✓ Validation passed: No conflicting Podcasting 2.0 tags found")
+            return self
 
-        # Tags we check at channel level
-        channel_tags_to_check = [
-            'guid', 'funding', 'medium', 'updateFrequency',
-            'podroll', 'socialInteract', 'person'
-        ]
+        # Check channel and item level, one compiled XPath each, bucketed by tag
+        channel_conflicts = Counter(
+            etree.QName(elem).localname for elem in _FIND_CHANNEL_CONFLICTS(self.channel)
+        )
+        item_conflicts = Counter(
+            etree.QName(elem).localname for elem in _FIND_ITEM_CONFLICTS(self.channel)
+        )
 
-        # Tags we check at item level
-        item_tags_to_check = ['season', 'episode', 'person']
+        self._check_conflicts(channel_conflicts, item_conflicts)
+        return self
 
-        conflicts = []
+    def validate_no_conflicts_streaming(self, source_path: Optional[str] = None) -> 'FeedEnricher':
+        """
+        Streaming variant of validate_no_conflicts() for large local feed files.
 
-        # Check channel level
-        for tag in channel_tags_to_check:
-            found = self.channel.findall(f'{{{PODCAST_NS}}}{tag}')
-            if found:
-                conflicts.append(f"podcast:{tag} (found {len(found)} at channel level)")
+        Parses the file incrementally with iterparse and discards each <item> once
+        it has been checked, so memory stays flat regardless of feed size. Can be
+        called before fetch_feed().
 
-        # Check item level
-        items = self.channel.findall('item')
-        item_conflicts = {}
-        for tag in item_tags_to_check:
-            for i, item in enumerate(items):
-                found = item.findall(f'{{{PODCAST_NS}}}{tag}')
-                if found:
-                    if tag not in item_conflicts:
-                        item_conflicts[tag] = 0
-                    item_conflicts[tag] += len(found)
-
-        for tag, count in item_conflicts.items():
-            conflicts.append(f"podcast:{tag} (found {count} across episodes)")
+        Args:
+            source_path: Local feed file to check (default: the enricher's source,
+                if that is a local file)
+
+        Raises:
+            ValueError: If any conflicting tags are found, or if no local file is
+                given and the enricher's source is a URL
+
+        Returns:
+            Self for chaining
+        """
+        if source_path is None:
+            if not os.path.isfile(self.source_url):
+                raise ValueError(
+                    "validate_no_conflicts_streaming needs a local feed file; "
+                    f"{self.source_url} is not one (use fetch_feed() and "
+                    "validate_no_conflicts() for remote feeds)"
+                )
+            source_path = self.source_url
+
+        channel_wanted = _CHANNEL_CONFLICT_CLARK
+        item_wanted = _ITEM_CONFLICT_CLARK
+        channel_conflicts = Counter()
+        item_conflicts = Counter()
+
+        for _, elem in etree.iterparse(
+            source_path, events=('end',), tag=('item', *channel_wanted, *item_wanted)
+        ):
+            if elem.tag == 'item':
+                # Done with this item: free it and any already-checked siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                continue
+
+            parent = elem.getparent()
+            if parent is None:
+                continue
+            if parent.tag == 'channel' and elem.tag in channel_wanted:
+                channel_conflicts[channel_wanted[elem.tag]] += 1
+            elif parent.tag == 'item' and elem.tag in item_wanted:
+                item_conflicts[item_wanted[elem.tag]] += 1
+
+        self._check_conflicts(channel_conflicts, item_conflicts)
+        return self
+
+    def _check_first_conflict(self) -> None:
+        """
+        Raise on the first conflicting tag, walking the channel and then items lazily.
+
+        Raises:
+            ValueError: If any conflicting tag is found
+        """
+        found = next(self.channel.iterchildren(*_CHANNEL_CONFLICT_CLARK), None)
+        if found is not None:
+            self._check_conflicts({_CHANNEL_CONFLICT_CLARK[found.tag]: 1}, {}, first_only=True)
+
+        for item in self.channel.iterchildren('item'):
+            found = next(item.iterchildren(*_ITEM_CONFLICT_CLARK), None)
+            if found is not None:
+                self._check_conflicts({}, {_ITEM_CONFLICT_CLARK[found.tag]: 1}, first_only=True)
+
+    def _check_conflicts(
+        self,
+        channel_conflicts: Dict[str, int],
+        item_conflicts: Dict[str, int],
+        first_only: bool = False
+    ) -> None:
+        """
+        Raise with a summary if any conflicting tags were counted.
+
+        Args:
+            channel_conflicts: {tag: count} of podcast tags found on the channel
+            item_conflicts: {tag: count} of podcast tags found across items
+            first_only: Report the tags as the first one found instead of with counts
+
+        Raises:
+            ValueError: If any conflicting tags are found
+        """
+        conflicts = []
+        for tag in _CHANNEL_CONFLICT_TAGS:
+            if tag in channel_conflicts:
+                if first_only:
+                    conflicts.append(f"podcast:{tag} (first conflict, at channel level)")
+                else:
+                    conflicts.append(
+                        f"podcast:{tag} (found {channel_conflicts[tag]} at channel level)"
+                    )
+        for tag in _ITEM_CONFLICT_TAGS:
+            if tag in item_conflicts:
+                if first_only:
+                    conflicts.append(f"podcast:{tag} (first conflict, in an episode)")
+                else:
+                    conflicts.append(f"podcast:{tag} (found {item_conflicts[tag]} across episodes)")
 
         if conflicts:
             error_msg = (
@@ -86,39 +497,42 @@ class FeedEnricher(BaseFeed):
             raise ValueError(error_msg)
 
         print("✓ Validation passed: No conflicting Podcasting 2.0 tags found")
-        return self
 
-    def remove_episode_numbers_from_titles(self, pattern: str = r'\s*\(#?\d+\)$') -> 'FeedEnricher':
+    def remove_episode_numbers_from_titles(
+        self,
+        pattern: Union[str, re.Pattern] = _EPISODE_NUMBER_RE
+    ) -> 'FeedEnricher':
         """
         Remove episode numbers from episode titles.
 
         Args:
-            pattern: Regex pattern to match episode numbers (default: matches "(#123)" or "(123)" at end of title)
+            pattern: Regex pattern (string or compiled) to match episode numbers
+                     (default: matches "(#123)" or "(123)" at end of title)
 
         Returns:
             Self for chaining
         """
-        import re
-
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        items = self.channel.findall('item')
+        number_re = re.compile(pattern)
         removed_count = 0
 
-        for item in items:
+        for item in self.channel.iterchildren('item'):
             # Update <title>
             title_elem = item.find('title')
-            if title_elem is not None and title_elem.text:
-                new_title = re.sub(pattern, '', title_elem.text).strip()
-                if new_title != title_elem.text:
+            title = title_elem.text if title_elem is not None else None
+            if title:
+                new_title = number_re.sub('', title).strip()
+                if new_title != title:
                     title_elem.text = new_title
                     removed_count += 1
 
             # Also update <itunes:title> if present
-            itunes_title = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}title')
-            if itunes_title is not None and itunes_title.text:
-                itunes_title.text = re.sub(pattern, '', itunes_title.text).strip()
+            itunes_title = item.find(_ITUNES_TITLE_TAG)
+            itunes_text = itunes_title.text if itunes_title is not None else None
+            if itunes_text:
+                itunes_title.text = number_re.sub('', itunes_text).strip()
 
         print(f"✓ Removed episode numbers from {removed_count} episode titles")
         return self
@@ -142,30 +556,24 @@ class FeedEnricher(BaseFeed):
         # Ensure podcast namespace is registered
         self._ensure_podcast_namespace()
 
-        # Add persons to channel
-        for person_data in persons:
-            person_elem = etree.Element(
-                '{https://podcastindex.org/namespace/1.0}person',
-                role=person_data.get('role', 'host')
-            )
-            person_elem.text = person_data['name']
-
-            if 'img' in person_data:
-                person_elem.set('img', person_data['img'])
-            if 'href' in person_data:
-                person_elem.set('href', person_data['href'])
-
-            # Insert after last itunes tag for organization
-            inserted = False
-            for i, elem in enumerate(self.channel):
-                if 'itunes' in elem.tag and i + 1 < len(self.channel):
-                    if 'itunes' not in self.channel[i + 1].tag:
-                        self.channel.insert(i + 1, person_elem)
-                        inserted = True
-                        break
+        # Insert after the first run of itunes tags for organization. The position
+        # is found once; each person is inserted there, ahead of the previous one.
+        children = list(self.channel)
+        insert_at = None
+        for i, elem in enumerate(children):
+            if _is_itunes(elem):
+                if i + 1 == len(children) or not _is_itunes(children[i + 1]):
+                    insert_at = i + 1
+                    break
 
-            if not inserted:
-                self.channel.append(person_elem)
+        # Add persons to channel
+        person_elems = self._build_person_elements(persons, 'host')
+        if insert_at is None:
+            self.channel.extend(person_elems)
+        else:
+            # Each person used to be inserted at the same index, ahead of the
+            # previous one; keep that order
+            self.channel[insert_at:insert_at] = person_elems[::-1]
 
         print(f"✓ Added {len(persons)} default host(s) to channel")
         return self
@@ -182,97 +590,103 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
+        return self.enrich_items(add_season=True, detect_guests=False, op3=False)
 
-        # Season name mapping (S1 = Vår 2020, S2 = Høst 2020, etc.)
-        def get_season_name(season_num: int) -> str:
-            """Generate season name from number."""
-            if season_num <= 0:
-                return f"Sesong {season_num}"
+    def _collect_season_episodes(self) -> tuple:
+        """
+        Read itunes:season and itunes:episode of every item in one pass.
 
-            # Calculate year and season
-            year = 2020 + (season_num - 1) // 2
-            is_spring = (season_num % 2) == 1
+        This is the only XML walk add_podcast_season_episode() needs; the
+        per-item step works from the collected numbers.
 
-            season_name = "Vår" if is_spring else "Høst"
-            return f"{season_name} {year}"
+        Returns:
+            Tuple of (records, season_episode_counts). records holds one
+            (season_num, episode_num, has_tags) tuple per item in document order,
+            with None for a missing or empty number; season_episode_counts maps
+            each season to its number of episodes.
+        """
+        records = []
+        season_episode_counts = Counter()
+        for item in self.channel.iterchildren('item'):
+            season_elem = item.find(_ITUNES_SEASON_TAG)
+            episode_elem = item.find(_ITUNES_EPISODE_TAG)
+
+            season_num = None
+            season_text = season_elem.text if season_elem is not None else None
+            if season_text:
+                season_num = int(season_text)
+                season_episode_counts[season_num] += 1
 
-        items = self.channel.findall('item')
+            episode_num = None
+            episode_text = episode_elem.text if episode_elem is not None else None
+            if episode_text:
+                episode_num = int(episode_text)
 
-        # First pass: count episodes per season (feed is in reverse chronological order)
-        season_episode_counts = {}
-        for item in items:
-            season_elem = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}season')
-            if season_elem is not None and season_elem.text:
-                season_num = int(season_elem.text)
-                if season_num not in season_episode_counts:
-                    season_episode_counts[season_num] = 0
-                season_episode_counts[season_num] += 1
+            records.append((
+                season_num,
+                episode_num,
+                season_elem is not None or episode_elem is not None
+            ))
+        return records, season_episode_counts
 
-        # Second pass: add podcast:season and podcast:episode tags
-        season_counters = {}
-        added_count = 0
+    def _add_season_episode_one(
+        self,
+        item: etree._Element,
+        record: tuple,
+        season_episode_counts: Dict[int, int],
+        season_counters: Dict[int, int]
+    ) -> bool:
+        """
+        Add podcast:season and podcast:episode to a single item.
 
-        for item in items:
-            # Find itunes:season and itunes:episode
-            season_elem = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}season')
-            episode_elem = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}episode')
-
-            if season_elem is not None and season_elem.text:
-                season_num = int(season_elem.text)
-                season_name = get_season_name(season_num)
-
-                # Add podcast:season
-                podcast_season = etree.Element(
-                    '{https://podcastindex.org/namespace/1.0}season',
-                    name=season_name
-                )
-                podcast_season.text = str(season_num)
-                item.append(podcast_season)
+        Args:
+            item: The <item> element
+            record: The item's entry from _collect_season_episodes()
+            season_episode_counts: Episodes per season
+            season_counters: Running per-season countdown, shared across items
 
-            if episode_elem is not None and episode_elem.text:
-                total_episode_num = int(episode_elem.text)
+        Returns:
+            True if the item had itunes:season or itunes:episode
+        """
+        season_num, total_episode_num, has_tags = record
 
-                # Calculate season episode number (reverse chronological order)
-                if season_elem is not None and season_elem.text:
-                    season_num = int(season_elem.text)
+        if season_num is not None:
+            season_name = _get_season_name(season_num)
 
-                    # Initialize counter for this season if not present
-                    if season_num not in season_counters:
-                        season_counters[season_num] = season_episode_counts[season_num]
+            # Add podcast:season
+            podcast_season = etree.Element(
+                _SEASON_TAG,
+                name=season_name
+            )
+            podcast_season.text = str(season_num)
+            item.append(podcast_season)
 
-                    # Get the episode number within the season
-                    season_episode_num = season_counters[season_num]
-                    season_counters[season_num] -= 1
+        if total_episode_num is not None:
+            # Calculate season episode number (reverse chronological order).
+            # Without season info, just use the total episode number.
+            attrib = {}
+            if season_num is not None:
+                # Initialize counter for this season if not present
+                season_episode_num = season_counters.get(season_num)
+                if season_episode_num is None:
+                    season_episode_num = season_episode_counts[season_num]
 
-                    # Create display attribute: "2 (#80)"
-                    display_value = f"{season_episode_num} (#{total_episode_num})"
+                # Count down to the next (older) episode in this season
+                season_counters[season_num] = season_episode_num - 1
 
-                    # Add podcast:episode with display attribute
-                    podcast_episode = etree.Element(
-                        '{https://podcastindex.org/namespace/1.0}episode',
-                        display=display_value
-                    )
-                    podcast_episode.text = str(total_episode_num)
-                    item.append(podcast_episode)
-                else:
-                    # No season info, just use total episode number
-                    podcast_episode = etree.Element(
-                        '{https://podcastindex.org/namespace/1.0}episode'
-                    )
-                    podcast_episode.text = str(total_episode_num)
-                    item.append(podcast_episode)
+                # Create display attribute: "2 (#80)"
+                attrib['display'] = f"{season_episode_num} (#{total_episode_num})"
 
-            if season_elem is not None or episode_elem is not None:
-                added_count += 1
+            # Add podcast:episode
+            podcast_episode = etree.Element(_EPISODE_TAG, attrib)
+            podcast_episode.text = str(total_episode_num)
+            item.append(podcast_episode)
 
-        print(f"✓ Added podcast:season and podcast:episode tags to {added_count} episodes")
-        return self
+        return has_tags
 
     def auto_detect_guests_from_titles(
         self,
-        pattern: str = r'med (.+?)(?:\s*\(|$)',
+        pattern: Union[str, re.Pattern] = r'med (.+?)(?:\s*\(|$)',
         known_guests: Optional[Dict[str, Dict[str, str]]] = None,
         split_multiple: bool = True
     ) -> 'FeedEnricher':
@@ -280,7 +694,9 @@ class FeedEnricher(BaseFeed):
         Automatically detect and add guests from episode titles.
 
         Args:
-            pattern: Regex pattern to extract guest names (default: "med Guest Name")
+            pattern: Regex pattern to extract guest names (default: "med Guest Name").
+                     Strings are compiled case-insensitively; a compiled pattern is
+                     used as is.
             known_guests: Optional dict mapping guest names to additional info
                          Example: {"Roar Granevang": {"href": "https://...", "img": "..."}}
                          Can include 'alias' key to normalize name variations:
@@ -292,21 +708,45 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        import re
+        return self.enrich_items(
+            add_season=False,
+            detect_guests=True,
+            op3=False,
+            guest_pattern=pattern,
+            known_guests=known_guests,
+            split_multiple=split_multiple,
+        )
 
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
+    def _prepare_guest_detection(
+        self,
+        pattern: Union[str, re.Pattern],
+        known_guests: Optional[Dict[str, Dict[str, str]]],
+        split_multiple: bool
+    ) -> Dict:
+        """
+        Set up the shared state for detecting guests item by item.
 
+        Returns:
+            Context dict passed to _detect_guests_one() and _report_guest_detection()
+        """
         if known_guests is None:
             known_guests = {}
 
-        items = self.channel.findall('item')
-        guest_count = 0
-        extra_episodes_count = 0
-        normalizations = []  # Track normalizations for reporting
-        missing_metadata = []  # Track guests without profile images
+        # Resolve every known name (canonical or alias) to its canonical name and
+        # info up front. Aliases take the canonical entry's info, falling back to
+        # the alias stub itself when the canonical name isn't listed.
+        guest_index = {}
+        for guest_name, guest_info in known_guests.items():
+            if 'alias' in guest_info:
+                canonical = guest_info['alias']
+                guest_index[guest_name] = (
+                    canonical, known_guests.get(canonical) or guest_info, True
+                )
+            else:
+                guest_index[guest_name] = (guest_name, guest_info, False)
 
-        # First pass: Handle extra_episodes (manual additions by GUID)
+        # Index extra_episodes (manual additions) by GUID, in known_guests order
+        extra_by_guid = {}
         for guest_name, guest_info in known_guests.items():
             if 'extra_episodes' not in guest_info:
                 continue
@@ -316,105 +756,152 @@ class FeedEnricher(BaseFeed):
                 continue
 
             for episode_spec in guest_info['extra_episodes']:
-                episode_guid = episode_spec['guid']
+                extra_by_guid.setdefault(episode_spec['guid'], []).append(
+                    (guest_name, guest_info, episode_spec)
+                )
 
-                # Find item with matching GUID
-                for item in items:
-                    guid_elem = item.find('guid')
-                    if guid_elem is None or not guid_elem.text:
-                        continue
+        if isinstance(pattern, re.Pattern):
+            title_re = pattern
+            # Whitespace is insignificant in verbose patterns, so no literal prefix
+            title_literal = '' if pattern.flags & re.VERBOSE else _literal_prefix(pattern.pattern)
+        else:
+            title_re = _compile_ci(pattern)
+            title_literal = _literal_prefix(pattern)
+
+        return {
+            'title_re': title_re,
+            'title_literal': title_literal,
+            'guest_index': guest_index,
+            'split_multiple': split_multiple,
+            'extra_by_guid': extra_by_guid,
+            'guest_count': 0,
+            'extra_episodes_count': 0,
+            'normalizations': [],  # Track normalizations for reporting
+            'missing_metadata': [],  # Track guests without profile images
+        }
+
+    def _detect_guests_one(self, item: etree._Element, ctx: Dict) -> None:
+        """
+        Add the extra_episodes and title-detected guests of a single item.
 
-                    if guid_elem.text == episode_guid:
-                        # Add guest to this episode (one person element per role)
-                        roles = episode_spec.get('role', 'guest')
-                        if isinstance(roles, str):
-                            roles = [roles]
+        Args:
+            item: The <item> element
+            ctx: Context dict from _prepare_guest_detection()
+        """
+        title_elem, guid_elem = _title_and_guid(item)
+
+        # Collected here and added to the item with one extend()
+        new_persons = []
+
+        # Manual additions by GUID. Popped so only the first item with a given
+        # GUID gets them.
+        guid = guid_elem.text if guid_elem is not None else None
+        if guid:
+            extra_episodes = ctx['extra_by_guid'].pop(guid, [])
+            for guest_name, guest_info, episode_spec in extra_episodes:
+                # Add guest to this episode (one person element per role)
+                roles = episode_spec.get('role', 'guest')
+                if isinstance(roles, str):
+                    roles = [roles]
+
+                for role in roles:
+                    attrib = {'role': role}
+                    if 'href' in guest_info:
+                        attrib['href'] = guest_info['href']
+                    if 'img' in guest_info:
+                        attrib['img'] = guest_info['img']
+
+                    person_elem = etree.Element(_PERSON_TAG, attrib)
+                    person_elem.text = guest_name
+                    new_persons.append(person_elem)
 
-                        for role in roles:
-                            person_elem = etree.Element(
-                                '{https://podcastindex.org/namespace/1.0}person',
-                                role=role
-                            )
-                            person_elem.text = guest_name
+                ctx['extra_episodes_count'] += 1
 
-                            if 'href' in guest_info:
-                                person_elem.set('href', guest_info['href'])
-                            if 'img' in guest_info:
-                                person_elem.set('img', guest_info['img'])
+        # Auto-detect from title
+        title = title_elem.text if title_elem is not None else None
+        if title:
+            new_persons.extend(self._guests_from_title(title, ctx))
 
-                            item.append(person_elem)
+        if new_persons:
+            item.extend(new_persons)
 
-                        extra_episodes_count += 1
-                        break
+    def _guests_from_title(self, title: str, ctx: Dict) -> List[etree._Element]:
+        """
+        Build the person elements for the guests named in an episode title.
 
-        # Second pass: Auto-detect from titles
-        for item in items:
-            title_elem = item.find('title')
-            if title_elem is None or not title_elem.text:
-                continue
+        Args:
+            title: Episode title text
+            ctx: Context dict from _prepare_guest_detection()
 
-            title = title_elem.text
+        Returns:
+            List of new podcast:person elements (empty if no guest was found)
+        """
+        guest_index = ctx['guest_index']
 
-            # Try to extract guest name(s) from title
-            match = re.search(pattern, title, re.IGNORECASE)
-            if match:
-                guest_names_raw = match.group(1).strip()
+        # Cheap substring prefilter before running the regex
+        title_literal = ctx['title_literal']
+        if title_literal and title_literal not in title.lower():
+            return []
 
-                # Remove episode number if present (e.g., " (#120)")
-                guest_names_raw = re.sub(r'\s*\(#?\d+\)$', '', guest_names_raw)
+        # Try to extract guest name(s) from title
+        match = ctx['title_re'].search(title)
+        if not match:
+            return []
 
-                # Split multiple guests if enabled
-                if split_multiple and ' og ' in guest_names_raw.lower():
-                    # Split on " og " (case insensitive)
-                    guest_names = re.split(r'\s+og\s+', guest_names_raw, flags=re.IGNORECASE)
-                else:
-                    guest_names = [guest_names_raw]
+        guest_names_raw = match.group(1).strip()
 
-                # Create person element for each guest
-                for guest_name in guest_names:
-                    guest_name = guest_name.strip()
-                    if not guest_name:
-                        continue
+        # Remove episode number if present (e.g., " (#120)")
+        guest_names_raw = _EPISODE_NUMBER_RE.sub('', guest_names_raw)
 
-                    # Check for alias/normalization
-                    original_name = guest_name
-                    if guest_name in known_guests and 'alias' in known_guests[guest_name]:
-                        normalized_name = known_guests[guest_name]['alias']
-                        normalizations.append(f"  '{original_name}' → '{normalized_name}'")
-                        guest_name = normalized_name
+        # Split multiple guests if enabled
+        if ctx['split_multiple'] and ' og ' in guest_names_raw.lower():
+            # Split on " og " (case insensitive)
+            guest_names = _OG_SPLIT_RE.split(guest_names_raw)
+        else:
+            guest_names = [guest_names_raw]
 
-                    person_elem = etree.Element(
-                        '{https://podcastindex.org/namespace/1.0}person',
-                        role='guest'
-                    )
-                    person_elem.text = guest_name
+        # Create person element for each guest
+        persons = []
+        for guest_name in guest_names:
+            guest_name = guest_name.strip()
+            if not guest_name:
+                continue
 
-                    # Look up canonical name first (guest_name is already normalized
-                    # from any alias). Falling back to original_name would return
-                    # an alias stub ({"alias": ...}) and miss the real href/img.
-                    guest_info = known_guests.get(guest_name, {})
-                    if not guest_info:
-                        guest_info = known_guests.get(original_name, {})
-
-                    has_href = False
-                    if guest_info:
-                        if 'href' in guest_info:
-                            person_elem.set('href', guest_info['href'])
-                            has_href = True
-                        if 'img' in guest_info:
-                            person_elem.set('img', guest_info['img'])
-
-                    # Track guests without href (Podchaser URL)
-                    # img is nice to have but not critical
-                    if not has_href:
-                        missing_metadata.append({
-                            'name': guest_name,
-                            'original_name': original_name if original_name != guest_name else None,
-                            'episode': title
-                        })
-
-                    item.append(person_elem)
-                    guest_count += 1
+            # Check for alias/normalization (one lookup resolves both the
+            # canonical name and its info)
+            original_name = guest_name
+            guest_name, guest_info, is_alias = guest_index.get(guest_name, (guest_name, {}, False))
+            if is_alias:
+                ctx['normalizations'].append(f"  '{original_name}' → '{guest_name}'")
+
+            attrib = {'role': 'guest'}
+            if 'href' in guest_info:
+                attrib['href'] = guest_info['href']
+            if 'img' in guest_info:
+                attrib['img'] = guest_info['img']
+
+            # Track guests without href (Podchaser URL)
+            # img is nice to have but not critical
+            if 'href' not in attrib:
+                ctx['missing_metadata'].append({
+                    'name': guest_name,
+                    'original_name': original_name if original_name != guest_name else None,
+                    'episode': title
+                })
+
+            person_elem = etree.Element(_PERSON_TAG, attrib)
+            person_elem.text = guest_name
+            persons.append(person_elem)
+            ctx['guest_count'] += 1
+
+        return persons
+
+    def _report_guest_detection(self, ctx: Dict) -> None:
+        """Print the guest detection summary, normalizations and missing metadata."""
+        guest_count = ctx['guest_count']
+        extra_episodes_count = ctx['extra_episodes_count']
+        normalizations = ctx['normalizations']
+        missing_metadata = ctx['missing_metadata']
 
         # Report summary
         total_added = guest_count + extra_episodes_count
@@ -464,8 +951,6 @@ class FeedEnricher(BaseFeed):
                 print(f"\n💡 If name variations exist, add aliases with:")
                 print(f"   uv run python3 scripts/guests/lookup_guest.py \"Full Name\" --alias \"Short Name\"")
 
-        return self
-
     def add_episode_persons(
         self,
         episode_mapping: Dict[str, List[Dict[str, str]]]
@@ -480,54 +965,101 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
+        return self.enrich_items(
+            add_season=False,
+            detect_guests=False,
+            op3=False,
+            episode_mapping=episode_mapping,
+        )
 
-        items = self.channel.findall('item')
-        matched = 0
+    def _prepare_episode_mapping(self, episode_mapping: Dict[str, List[Dict[str, str]]]) -> Dict:
+        """
+        Precompute the lowercased mapping keys for the partial title match.
 
-        for item in items:
-            # Try to match by title
-            title_elem = item.find('title')
-            title = title_elem.text if title_elem is not None else ''
-
-            # Try to match by guid
-            guid_elem = item.find('guid')
-            guid = guid_elem.text if guid_elem is not None else ''
-
-            # Check if this episode has person mappings
-            persons = None
-            if title in episode_mapping:
-                persons = episode_mapping[title]
-            elif guid in episode_mapping:
-                persons = episode_mapping[guid]
-
-            # Also try partial title match (useful for "with Guest Name" patterns)
-            if not persons:
-                for key in episode_mapping:
-                    if key.lower() in title.lower():
-                        persons = episode_mapping[key]
+        Returns:
+            Context dict passed to _add_episode_persons_one()
+        """
+        lowered_mapping = [(key.lower(), persons) for key, persons in episode_mapping.items()]
+        key_matcher = None
+        if lowered_mapping:
+            # One alternation over all lowercased mapping keys: a single C-level
+            # scan rules out the partial title match before trying keys in order
+            key_matcher = re.compile('|'.join(re.escape(lowered) for lowered, _ in lowered_mapping))
+
+        return {
+            'mapping': episode_mapping,
+            'lowered_mapping': lowered_mapping,
+            'key_matcher': key_matcher,
+        }
+
+    def _add_episode_persons_one(self, item: etree._Element, ctx: Dict) -> bool:
+        """
+        Add the mapped persons to a single item.
+
+        Args:
+            item: The <item> element
+            ctx: Context dict from _prepare_episode_mapping()
+
+        Returns:
+            True if the item matched an entry in episode_mapping
+        """
+        episode_mapping = ctx['mapping']
+        key_matcher = ctx['key_matcher']
+
+        # Try to match by title or guid
+        title_elem, guid_elem = _title_and_guid(item)
+        title = (title_elem.text or '') if title_elem is not None else ''
+        guid = guid_elem.text if guid_elem is not None else ''
+
+        # Check if this episode has person mappings
+        persons = None
+        if title in episode_mapping:
+            persons = episode_mapping[title]
+        elif guid in episode_mapping:
+            persons = episode_mapping[guid]
+
+        # Also try partial title match (useful for "with Guest Name" patterns)
+        if not persons and key_matcher is not None:
+            title_lc = title.lower()
+            if key_matcher.search(title_lc):
+                for key_lc, key_persons in ctx['lowered_mapping']:
+                    if key_lc in title_lc:
+                        persons = key_persons
                         break
 
-            if persons:
-                for person_data in persons:
-                    person_elem = etree.Element(
-                        '{https://podcastindex.org/namespace/1.0}person',
-                        role=person_data.get('role', 'guest')
-                    )
-                    person_elem.text = person_data['name']
+        if not persons:
+            return False
 
-                    if 'img' in person_data:
-                        person_elem.set('img', person_data['img'])
-                    if 'href' in person_data:
-                        person_elem.set('href', person_data['href'])
+        item.extend(self._build_person_elements(persons, 'guest'))
+        return True
 
-                    item.append(person_elem)
+    def _build_person_elements(
+        self,
+        persons: List[Dict[str, str]],
+        default_role: str
+    ) -> List[etree._Element]:
+        """
+        Build podcast:person elements from person dicts.
 
-                matched += 1
+        Args:
+            persons: List of person dicts with keys: name, role, img, href
+            default_role: Role used when a person dict has none
 
-        print(f"✓ Added persons to {matched} episodes")
-        return self
+        Returns:
+            List of new podcast:person elements, in input order
+        """
+        person_elems = []
+        for person_data in persons:
+            attrib = {'role': person_data.get('role', default_role)}
+            if 'img' in person_data:
+                attrib['img'] = person_data['img']
+            if 'href' in person_data:
+                attrib['href'] = person_data['href']
+
+            person_elem = etree.Element(_PERSON_TAG, attrib)
+            person_elem.text = person_data['name']
+            person_elems.append(person_elem)
+        return person_elems
 
     def add_funding(
         self,
@@ -548,7 +1080,7 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         funding_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}funding',
+            _FUNDING_TAG,
             url=url
         )
         funding_elem.text = message
@@ -581,19 +1113,15 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        social_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}socialInteract',
-            protocol=protocol,
-            uri=uri
-        )
+        attrib = {'protocol': protocol, 'uri': uri}
         if account_id:
-            social_elem.set('accountId', account_id)
+            attrib['accountId'] = account_id
         if account_url:
-            social_elem.set('accountUrl', account_url)
+            attrib['accountUrl'] = account_url
         if priority is not None:
-            social_elem.set('priority', str(priority))
+            attrib['priority'] = str(priority)
 
-        self.channel.append(social_elem)
+        etree.SubElement(self.channel, _SOCIAL_INTERACT_TAG, attrib)
         print(f"✓ Added social interact: {protocol} ({uri})")
         return self
 
@@ -619,12 +1147,12 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         # Remove existing guid if present
-        existing = self.channel.find('{https://podcastindex.org/namespace/1.0}guid')
+        existing = self.channel.find(_GUID_TAG)
         if existing is not None:
             self.channel.remove(existing)
 
         guid_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}guid'
+            _GUID_TAG
         )
         guid_elem.text = guid
 
@@ -649,7 +1177,7 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         medium_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}medium'
+            _MEDIUM_TAG
         )
         medium_elem.text = medium
 
@@ -677,7 +1205,7 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         podroll_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}podroll'
+            _PODROLL_TAG
         )
 
         for podcast in podcasts:
@@ -691,11 +1219,7 @@ class FeedEnricher(BaseFeed):
             if 'title' in podcast:
                 attrs['title'] = podcast['title']
 
-            remote_elem = etree.SubElement(
-                podroll_elem,
-                '{https://podcastindex.org/namespace/1.0}remoteItem',
-                **attrs
-            )
+            etree.SubElement(podroll_elem, _REMOTE_ITEM_TAG, attrs)
 
         self.channel.append(podroll_elem)
         print(f"✓ Added podroll with {len(podcasts)} recommended podcasts")
@@ -724,7 +1248,7 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         freq_elem = etree.Element(
-            '{https://podcastindex.org/namespace/1.0}updateFrequency'
+            _UPDATE_FREQUENCY_TAG
         )
 
         if complete:
@@ -761,29 +1285,104 @@ class FeedEnricher(BaseFeed):
         This provides free, public stats without compromising listener privacy.
         Stats page: https://op3.dev/show/[your-show-guid]
 
+        Returns:
+            Self for chaining
+        """
+        return self.enrich_items(add_season=False, detect_guests=False, op3=True)
+
+    def _add_op3_prefix_one(self, item: etree._Element) -> bool:
+        """
+        Prefix the enclosure URL of a single item with OP3.
+
+        Returns:
+            True if the URL was prefixed
+        """
+        enclosure = item.find('enclosure')
+        if enclosure is None:
+            return False
+
+        url = enclosure.get('url')
+        if not url or url.startswith(OP3_PREFIX):
+            return False
+
+        # Strip https:// prefix if present (http:// URLs keep the protocol)
+        enclosure.set('url', OP3_PREFIX + url.removeprefix('https://'))
+        return True
+
+    def enrich_items(
+        self,
+        *,
+        add_season: bool = True,
+        detect_guests: bool = True,
+        op3: bool = True,
+        episode_mapping: Optional[Dict[str, List[Dict[str, str]]]] = None,
+        guest_pattern: Union[str, re.Pattern] = r'med (.+?)(?:\s*\(|$)',
+        known_guests: Optional[Dict[str, Dict[str, str]]] = None,
+        split_multiple: bool = True,
+    ) -> 'FeedEnricher':
+        """
+        Run the per-item enrichments in a single walk over the items.
+
+        Equivalent to calling add_podcast_season_episode(),
+        auto_detect_guests_from_titles(), add_episode_persons() and
+        add_op3_prefix() in that order, but each item is visited once instead of
+        once per method.
+
+        Args:
+            add_season: Run add_podcast_season_episode()
+            detect_guests: Run auto_detect_guests_from_titles()
+            op3: Run add_op3_prefix()
+            episode_mapping: If given, run add_episode_persons() with it
+            guest_pattern, known_guests, split_multiple: Passed to the guest detection
+
         Returns:
             Self for chaining
         """
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        OP3_PREFIX = "https://op3.dev/e/"
-        items = self.channel.findall('item')
+        # Season numbering counts down within each season, so it needs the
+        # per-season totals up front
+        if add_season:
+            season_records, season_episode_counts = self._collect_season_episodes()
+            season_counters = {}
+        guest_ctx = None
+        if detect_guests:
+            guest_ctx = self._prepare_guest_detection(guest_pattern, known_guests, split_multiple)
+
+        mapping_ctx = None
+        if episode_mapping is not None:
+            mapping_ctx = self._prepare_episode_mapping(episode_mapping)
+
+        season_count = 0
+        matched = 0
         prefixed_count = 0
 
-        for item in items:
-            enclosure = item.find('enclosure')
-            if enclosure is not None:
-                url = enclosure.get('url')
-                if url and not url.startswith(OP3_PREFIX):
-                    # Strip https:// prefix if present (http:// URLs keep the protocol)
-                    if url.startswith('https://'):
-                        url = url[8:]  # Remove 'https://'
-                    enclosure.set('url', OP3_PREFIX + url)
-                    prefixed_count += 1
-
-        print(f"✓ Added OP3 analytics prefix to {prefixed_count} episode enclosures")
-        print(f"  Stats will be available at: https://op3.dev/show/[your-show-guid]")
+        for index, item in enumerate(self.channel.iterchildren('item')):
+            if add_season and self._add_season_episode_one(
+                item, season_records[index], season_episode_counts, season_counters
+            ):
+                season_count += 1
+
+            if detect_guests:
+                self._detect_guests_one(item, guest_ctx)
+
+            if mapping_ctx is not None and self._add_episode_persons_one(item, mapping_ctx):
+                matched += 1
+
+            if op3 and self._add_op3_prefix_one(item):
+                prefixed_count += 1
+
+        if add_season:
+            print(f"✓ Added podcast:season and podcast:episode tags to {season_count} episodes")
+        if detect_guests:
+            self._report_guest_detection(guest_ctx)
+        if episode_mapping is not None:
+            print(f"✓ Added persons to {matched} episodes")
+        if op3:
+            print(f"✓ Added OP3 analytics prefix to {prefixed_count} episode enclosures")
+            print(f"  Stats will be available at: https://op3.dev/show/[your-show-guid]")
+
         return self
 
     def add_language_to_transcripts(
@@ -804,12 +1403,10 @@ class FeedEnricher(BaseFeed):
             raise ValueError("Must fetch feed first")
 
         overrides = overrides or {}
-        ns = "https://podcastindex.org/namespace/1.0"
-        items = self.channel.findall('item')
         count = 0
 
-        for item in items:
-            transcript = item.find(f'{{{ns}}}transcript')
+        for item in self.channel.iterchildren('item'):
+            transcript = item.find(_TRANSCRIPT_TAG)
             if transcript is None:
                 continue
 
@@ -864,60 +1461,73 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
+        return self.apply_all(
+            convert_chapters=True,
+            format_elements=False,
+            restore_numbers=False,
+            chapter_desc=False,
+            chapters_dir=chapters_dir,
+            output_dir=output_dir,
+            base_url=base_url,
+            include_psc_tags=include_psc_tags,
+        )
 
-        # Ensure PSC namespace is registered (only needed when inserting PSC tags)
-        psc_ns = "http://podlove.org/simple-chapters"
-        if include_psc_tags and psc_ns not in self.root.nsmap.values():
-            # Add namespace to root element
-            nsmap = self.root.nsmap.copy()
-            nsmap['psc'] = psc_ns
-            # Create new root with updated namespaces
-            new_root = etree.Element(self.root.tag, nsmap=nsmap)
-            new_root.text = self.root.text
-            new_root.tail = self.root.tail
-            for key, value in self.root.attrib.items():
-                new_root.set(key, value)
-            for child in self.root:
-                new_root.append(child)
-            self.root = new_root
-            self.channel = self.root.find('channel')
+    def _prepare_chapter_conversion(
+        self,
+        items: List[etree._Element],
+        chapters_dir: str,
+        output_dir: str,
+        base_url: str,
+        include_psc_tags: bool
+    ) -> Dict:
+        """
+        Set up the shared state for converting chapters item by item.
 
-        items = self.channel.findall('item')
-        converted_count = 0
-        failed_count = 0
-        local_count = 0
-        used_local_files = set()  # Track which local files are used
+        Registers the PSC namespace, builds the episode cover index and fetches
+        every remote chapter JSON up front.
+
+        Returns:
+            Context dict passed to _convert_chapters_one() and _report_chapter_conversion()
+        """
+        # If the root doesn't declare the PSC namespace yet, declare it on each new
+        # psc:chapters element and hoist it to the root once all items are done
+        # (see _register_psc_namespace), instead of rebuilding the root up front
+        declare_psc = include_psc_tags and PSC_NS not in self.root.nsmap.values()
 
         # Create output directory for hosted chapter files
         os.makedirs(output_dir, exist_ok=True)
 
-        # Helper function for word-based matching
-        def normalize_words(text):
-            """Remove punctuation and split into words for fuzzy matching."""
-            translator = str.maketrans('', '', string.punctuation)
-            clean_text = text.translate(translator)
-            return set(clean_text.lower().split())
-
         # Get podcast logo for standard chapters
         podcast_logo = None
-        channel_image = self.channel.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}image')
+        channel_image = self.channel.find(_ITUNES_IMAGE_TAG)
         if channel_image is not None:
             podcast_logo = channel_image.get('href')
 
         # Build episode index for previous/next episode cover art
         # Also build a mapping from game names to their episode cover art
+        # Titles (for reporting) are collected in the same pass, and so are the
+        # chapter URLs to prefetch below; a dict keeps the URLs unique and in
+        # feed order.
         episode_covers = []
+        episode_titles = []
         episode_titles_to_covers = {}
+        chapter_urls = {}
 
         for item in items:
-            itunes_image = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}image')
+            itunes_image = item.find(_ITUNES_IMAGE_TAG)
             cover_url = itunes_image.get('href') if itunes_image is not None else None
             episode_covers.append(cover_url)
 
-            # Extract game name from episode title for cross-referencing
             title_elem = item.find('title')
+            episode_titles.append(title_elem.text if title_elem is not None else 'Unknown')
+
+            podcast_chapters = _first(_FIND_PODCAST_CHAPTERS(item))
+            if podcast_chapters is not None:
+                json_url = podcast_chapters.get('url')
+                if json_url and json_url.endswith('.json'):
+                    chapter_urls[json_url] = None
+
+            # Extract game name from episode title for cross-referencing
             if title_elem is not None and cover_url:
                 full_title = title_elem.text or ''
                 # Remove guest names: "Rainbow Six med Jostein Hakestad" -> "Rainbow Six"
@@ -933,452 +1543,511 @@ class FeedEnricher(BaseFeed):
                     base_name = game_name_normalized.split(':')[0].strip()
                     episode_titles_to_covers[base_name.lower()] = cover_url
 
-        for item_index, item in enumerate(items):
-            # Find podcast:chapters element
-            podcast_chapters = item.find('{https://podcastindex.org/namespace/1.0}chapters')
+        # Episode names of more than 3 characters, as (name, cover) pairs, and the
+        # same with a leading "the " dropped for the prefix match; derived once
+        # per feed instead of once per chapter
+        cover_names = [
+            (episode_name, cover)
+            for episode_name, cover in episode_titles_to_covers.items()
+            if len(episode_name) > 3
+        ]
+        cover_prefixes = [
+            (episode_name[4:] if episode_name.startswith("the ") else episode_name, cover)
+            for episode_name, cover in cover_names
+        ]
 
-            if podcast_chapters is not None:
-                json_url = podcast_chapters.get('url')
-                if json_url and json_url.endswith('.json'):
+        # Word sets of the episode names used by the word-based matching,
+        # normalized once per feed instead of once per chapter, plus an inverted
+        # word -> [position in cover_words] index so a chapter only scores the
+        # episodes it shares a word with
+        cover_words = [
+            (_normalize_words(episode_name), cover) for episode_name, cover in cover_names
+        ]
+        cover_word_index = {}
+        for position, (episode_words, _) in enumerate(cover_words):
+            for word in episode_words:
+                cover_word_index.setdefault(word, []).append(position)
+
+        # Fetch every chapter JSON concurrently up front. Only the downloads run
+        # in worker threads; the tree is mutated serially afterwards (lxml elements
+        # aren't thread-safe). Episodes sharing a chapters URL fetch it once.
+        fetch = partial(_fetch_json, self._session)
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+            remote_chapters = dict(zip(chapter_urls, executor.map(fetch, chapter_urls)))
+
+        return {
+            'chapters_dir': chapters_dir,
+            'output_dir': output_dir,
+            'base_url': base_url,
+            'include_psc_tags': include_psc_tags,
+            'psc_nsmap': {'psc': PSC_NS} if declare_psc else None,
+            'podcast_logo': podcast_logo,
+            'episode_covers': episode_covers,
+            'episode_titles': episode_titles,
+            'episode_titles_to_covers': episode_titles_to_covers,
+            'cover_suffix_trie': _build_suffix_trie(episode_titles_to_covers),
+            'cover_names': cover_names,
+            'cover_prefixes': cover_prefixes,
+            'cover_words': cover_words,
+            'cover_word_index': cover_word_index,
+            'remote_chapters': remote_chapters,
+            'converted_count': 0,
+            'failed_count': 0,
+            'local_count': 0,
+            'used_local_files': set(),  # Track which local files are used
+            'warnings': [],  # Per-episode warnings, printed together afterwards
+        }
+
+    def _convert_chapters_one(self, item: etree._Element, item_index: int, ctx: Dict) -> None:
+        """
+        Convert the chapters of a single item (see convert_json_chapters_to_psc).
+
+        Args:
+            item: The <item> element
+            item_index: Position of the item in the feed (for prev/next cover art)
+            ctx: Context dict from _prepare_chapter_conversion()
+        """
+        # Find podcast:chapters element
+        podcast_chapters = _first(_FIND_PODCAST_CHAPTERS(item))
+        if podcast_chapters is None:
+            return
+
+        json_url = podcast_chapters.get('url')
+        if not json_url or not json_url.endswith('.json'):
+            return
+
+        chapters_dir = ctx['chapters_dir']
+        output_dir = ctx['output_dir']
+        base_url = ctx['base_url']
+        include_psc_tags = ctx['include_psc_tags']
+        podcast_logo = ctx['podcast_logo']
+        episode_covers = ctx['episode_covers']
+        episode_titles_to_covers = ctx['episode_titles_to_covers']
+        remote_chapters = ctx['remote_chapters']
+        warnings = ctx['warnings']
+
+        try:
+            chapters_data = None
+            source_type = "remote"
+
+            # Extract filename from URL (e.g., "Outrun_chapters.json")
+            url_path = urlparse(json_url).path
+            filename = os.path.basename(url_path)
+            local_file = os.path.join(chapters_dir, filename)
+
+            # Try to load local chapter file first
+            if os.path.exists(local_file):
+                try:
+                    # Decode from bytes like _fetch_json (json.loads detects the encoding)
+                    with open(local_file, 'rb') as f:
+                        chapters_data = json.loads(f.read())
+                    source_type = "local"
+                    ctx['local_count'] += 1
+                    ctx['used_local_files'].add(filename)
+
+                    # Validate against Podbean version
                     try:
-                        chapters_data = None
-                        source_type = "remote"
-
-                        # Extract filename from URL (e.g., "Outrun_chapters.json")
-                        url_path = urlparse(json_url).path
-                        filename = os.path.basename(url_path)
-                        local_file = os.path.join(chapters_dir, filename)
-
-                        # Try to load local chapter file first
-                        if os.path.exists(local_file):
-                            try:
-                                with open(local_file, 'r', encoding='utf-8') as f:
-                                    chapters_data = json.load(f)
-                                source_type = "local"
-                                local_count += 1
-                                used_local_files.add(filename)
-
-                                # Validate against Podbean version
-                                try:
-                                    response = requests.get(json_url, timeout=10)
-                                    response.raise_for_status()
-                                    podbean_data = response.json()
-
-                                    local_chapter_count = len(chapters_data.get('chapters', []))
-                                    podbean_chapter_count = len(podbean_data.get('chapters', []))
-
-                                    if local_chapter_count != podbean_chapter_count:
-                                        title_elem = item.find('title')
-                                        episode_title = title_elem.text if title_elem is not None else 'Unknown'
-                                        print(f"  ⚠️  Chapter count mismatch: {episode_title}")
-                                        print(f"      Local file: {local_chapter_count} chapters ({filename})")
-                                        print(f"      Podbean:    {podbean_chapter_count} chapters")
-                                        print(f"      Check if the local file needs updating")
-
-                                except Exception:
-                                    # If we can't fetch Podbean version for comparison, that's okay
-                                    pass
-
-                            except Exception as e:
-                                # Fall back to remote if local file is invalid
-                                print(f"  ⚠️  Failed to load local file {filename}: {e}")
-                                pass
-
-                        # Fall back to fetching from URL if no local file
-                        if chapters_data is None:
-                            response = requests.get(json_url, timeout=10)
-                            response.raise_for_status()
-                            chapters_data = response.json()
-
-                        # Process chapters data (sorting, intro, images) before saving and PSC conversion
-                        if 'chapters' in chapters_data:
-                            original_chapters = chapters_data['chapters']
-
-                            # Get episode title for reporting
-                            title_elem = item.find('title')
-                            episode_title = title_elem.text if title_elem is not None else 'Unknown'
-
-                            # Detect if chapters are unsorted in source JSON
-                            is_unsorted = any(
-                                original_chapters[i].get('startTime', 0) > original_chapters[i+1].get('startTime', 0)
-                                for i in range(len(original_chapters) - 1)
-                            )
+                        podbean_data = remote_chapters[json_url]
+                        if podbean_data is None:
+                            raise ValueError(f"Could not fetch {json_url}")
+
+                        local_chapter_count = len(chapters_data.get('chapters', []))
+                        podbean_chapter_count = len(podbean_data.get('chapters', []))
+
+                        if local_chapter_count != podbean_chapter_count:
+                            episode_title = ctx['episode_titles'][item_index]
+                            warnings.append(f"  ⚠️  Chapter count mismatch: {episode_title}")
+                            warnings.append(f"      Local file: {local_chapter_count} chapters ({filename})")
+                            warnings.append(f"      Podbean:    {podbean_chapter_count} chapters")
+                            warnings.append(f"      Check if the local file needs updating")
+
+                    except Exception:
+                        # If we can't fetch Podbean version for comparison, that's okay
+                        pass
+
+                except Exception as e:
+                    # Fall back to remote if local file is invalid
+                    warnings.append(f"  ⚠️  Failed to load local file {filename}: {e}")
+                    pass
+
+            # Fall back to the fetched remote copy if no local file.
+            # Copy it, since processing below mutates the chapters.
+            if chapters_data is None:
+                if remote_chapters[json_url] is None:
+                    raise ValueError(f"Could not fetch {json_url}")
+                chapters_data = copy.deepcopy(remote_chapters[json_url])
+
+            # Process chapters data (sorting, intro, images) before saving and PSC conversion
+            if 'chapters' in chapters_data:
+                original_chapters = chapters_data['chapters']
+
+                # Get episode title for reporting
+                episode_title = ctx['episode_titles'][item_index]
+
+                # Detect if chapters are unsorted in source JSON (start times read once)
+                start_times = [ch.get('startTime', 0) for ch in original_chapters]
+                is_unsorted = any(a > b for a, b in pairwise(start_times))
+
+                if is_unsorted:
+                    source_label = "local file" if source_type == "local" else json_url
+                    warnings.append(f"  ⚠️  Unsorted chapters detected: {episode_title}")
+                    warnings.append(f"      Source: {source_label}")
+
+                # Sort chapters by startTime to ensure chronological order. Already
+                # sorted input (the common case) only needs a copy; otherwise sort
+                # on the start times read above (stable, like the key-based sort).
+                if is_unsorted:
+                    sorted_chapters = [
+                        ch for _, ch in sorted(zip(start_times, original_chapters), key=itemgetter(0))
+                    ]
+                else:
+                    sorted_chapters = list(original_chapters)
 
-                            if is_unsorted:
-                                source_label = "local file" if source_type == "local" else json_url
-                                print(f"  ⚠️  Unsorted chapters detected: {episode_title}")
-                                print(f"      Source: {source_label}")
+                # Check if first chapter starts at 0:00 (excluding hidden chapters)
+                visible_chapters = [ch for ch in sorted_chapters if ch.get('toc', True)]
+                missing_intro = (
+                    len(visible_chapters) > 0 and
+                    visible_chapters[0].get('startTime', 0) > 0
+                )
 
-                            # Sort chapters by startTime to ensure chronological order
-                            sorted_chapters = sorted(
-                                original_chapters,
-                                key=lambda ch: ch.get('startTime', 0)
-                            )
+                if missing_intro:
+                    warnings.append(f"  ⚠️  Missing 00:00 intro chapter: {episode_title}")
+                    warnings.append(f"      Source JSON: {json_url}")
 
-                            # Check if first chapter starts at 0:00 (excluding hidden chapters)
-                            visible_chapters = [ch for ch in sorted_chapters if ch.get('toc', True)]
-                            missing_intro = (
-                                len(visible_chapters) > 0 and
-                                visible_chapters[0].get('startTime', 0) > 0
+                    # Add intro chapter at 00:00
+                    intro_chapter = {
+                        'startTime': 0,
+                        'title': 'Intro'
+                    }
+                    sorted_chapters.insert(0, intro_chapter)
+
+                # Update chapters_data with sorted (and possibly intro-added) chapters
+                chapters_data['chapters'] = sorted_chapters
+
+                # Get episode cover art for image injection
+                cover_art_url = episode_covers[item_index]
+
+                # Get previous and next episode cover art
+                prev_cover_url = episode_covers[item_index + 1] if item_index + 1 < len(episode_covers) else None
+                next_cover_url = episode_covers[item_index - 1] if item_index > 0 else None
+
+                # Inject images for standard chapters (for ALL episodes, not just local)
+                images_injected = 0
+                for chapter in sorted_chapters:
+                    chapter_title = chapter.get('title', '').strip()
+
+                    # Skip if chapter already has an image (including null to disable auto-matching)
+                    # You can use "img": null in chapter file to prevent auto-matching
+                    # (empty/null values are cleaned up before saving output)
+                    if 'img' in chapter:
+                        continue
+
+                    # Normalize apostrophes for consistent matching
+                    chapter_title_normalized = chapter_title.replace('\u2019', "'")
+                    chapter_title_lower = chapter_title_normalized.lower()
+                    start_time = chapter.get('startTime', 0)
+
+                    # Match patterns for image injection
+                    image_to_inject = None
+
+                    # FIRST CHAPTER: Always gets episode cover (regardless of title)
+                    if start_time == 0 and cover_art_url:
+                        image_to_inject = cover_art_url
+
+                    # Episode cover art patterns
+                    elif cover_art_url and (
+                        chapter_title.startswith("Dagens") or
+                        chapter_title_lower.startswith("idag:") or
+                        chapter_title.startswith("Episodens") or
+                        chapter_title == "Hva går spillet ut på?" or
+                        chapter_title == "Har det holdt seg?" or
+                        chapter_title == "Kommentarer fra sosiale medier" or
+                        "fra sosiale medier" in chapter_title_lower or
+                        "facebook" in chapter_title_lower or
+                        "twitter" in chapter_title_lower or
+                        "bluesky" in chapter_title_lower
+                    ):
+                        image_to_inject = cover_art_url
+
+                    # Podcast logo patterns
+                    elif podcast_logo and "cd spill" in chapter_title_lower:
+                        image_to_inject = podcast_logo
+
+                    # Previous episode cover art patterns
+                    elif prev_cover_url and (
+                        "fra sist" in chapter_title_lower or
+                        "fra forrige" in chapter_title_lower
+                    ):
+                        image_to_inject = prev_cover_url
+
+                    # Next episode cover art patterns
+                    elif next_cover_url and (
+                        "neste" in chapter_title_lower
+                    ):
+                        image_to_inject = next_cover_url
+
+                    # Music and tech chapters (using episode cover for now)
+                    # TODO: Replace with dedicated images when available:
+                    #   - "Musikken" -> music note icon
+                    #   - "Tech Specs" -> technical icon
+                    elif cover_art_url and (
+                        "musikk" in chapter_title_lower or
+                        "tech" in chapter_title_lower
+                    ):
+                        image_to_inject = cover_art_url
+
+                    # Cross-reference: Match chapter title against episode game names
+                    # Example: "Home Alone" chapter in OutRun episode gets Home Alone episode cover
+                    elif chapter_title_lower in episode_titles_to_covers:
+                        image_to_inject = episode_titles_to_covers[chapter_title_lower]
+
+                    # Exact suffix matching: Chapter ends with episode name
+                    # Example: "Historien i Duke Nukem" → Duke Nukem episode
+                    # Also normalize "the " prefix for better matching
+                    # Example: "Oppsummering av Secret of Monkey Island" → "The Secret of Monkey Island"
+                    # Only normalize if result has multiple words (to avoid "the games" → "games" false matches)
+                    # (names are indexed once per feed in a reversed-character trie;
+                    # the first matching name in feed order wins)
+                    if not image_to_inject:
+                        image_to_inject = _match_suffix(ctx['cover_suffix_trie'], chapter_title_lower)
+
+                    # PREFIX matching: Chapter starts with episode name
+                    # Example: "Doom II" → "Doom", "Transport Tycoon Deluxe" → "Transport Tycoon"
+                    # Choose LONGEST matching prefix to avoid false matches
+                    # (e.g., "Legend of Kyrandia" should match "the legend of kyrandia: hand of fate" not just "legend")
+                    # Also normalize "the " prefix for better matching
+                    if not image_to_inject:
+                        best_prefix_match = None
+                        best_prefix_length = 0
+
+                        # Normalize chapter title by removing "the " prefix
+                        chapter_normalized = chapter_title_lower
+                        if chapter_normalized.startswith("the "):
+                            chapter_normalized = chapter_normalized[4:]
+
+                        # (episode names come with "the " already removed)
+                        for episode_normalized, cover in ctx['cover_prefixes']:
+                            # Check if chapter starts with episode name (using normalized versions)
+                            if chapter_normalized.startswith(episode_normalized):
+                                # Keep the longest match (use normalized length for comparison)
+                                if len(episode_normalized) > best_prefix_length:
+                                    best_prefix_match = cover
+                                    best_prefix_length = len(episode_normalized)
+
+                        if best_prefix_match:
+                            image_to_inject = best_prefix_match
+
+                    # Reverse PREFIX matching: Episode name starts with chapter
+                    # Example: "Backpacker" → "Backpacker 2"
+                    # Choose LONGEST matching episode name to avoid false matches
+                    if not image_to_inject:
+                        best_reverse_match = None
+                        best_reverse_length = 0
+
+                        # (a name starting with a chapter title of more than 3
+                        # characters is itself longer than 3, so cover_names suffices)
+                        if len(chapter_title_lower) <= 3:
+                            reverse_candidates = ()
+                        else:
+                            reverse_candidates = ctx['cover_names']
+
+                        for episode_name, cover in reverse_candidates:
+                            if episode_name.startswith(chapter_title_lower):
+                                # Keep the longest episode name match
+                                if len(episode_name) > best_reverse_length:
+                                    best_reverse_match = cover
+                                    best_reverse_length = len(episode_name)
+
+                        if best_reverse_match:
+                            image_to_inject = best_reverse_match
+
+                    # "I forhold til [game]" - cross-reference to that game's episode
+                    if not image_to_inject and "i forhold til" in chapter_title_lower:
+                        game_name = chapter_title_lower.split("i forhold til", 1)[1].strip()
+                        if game_name in episode_titles_to_covers:
+                            image_to_inject = episode_titles_to_covers[game_name]
+
+                    # "Ligner på [game]" - cross-reference to that game's episode
+                    if not image_to_inject and "ligner på" in chapter_title_lower:
+                        game_name = chapter_title_lower.split("ligner på", 1)[1].strip()
+                        if game_name in episode_titles_to_covers:
+                            image_to_inject = episode_titles_to_covers[game_name]
+
+                    # CONTAINS matching for "Mer [game]" pattern
+                    # Example: "Mer Warcraft II" → contains "warcraft"
+                    if not image_to_inject and chapter_title_lower.startswith("mer "):
+                        for episode_name, cover in ctx['cover_names']:
+                            if episode_name in chapter_title_lower:
+                                image_to_inject = cover
+                                break
+
+                    # "Kommentarer fra [episode]" - match episode name (not previous, not social media)
+                    if not image_to_inject and chapter_title_lower.startswith("kommentarer fra "):
+                        # Skip if it's social media or previous episode (already handled above)
+                        if not any(x in chapter_title_lower for x in _KOMMENTARER_SKIP_WORDS):
+                            # Extract potential episode name
+                            potential_name = chapter_title_lower.replace("kommentarer fra ", "").strip()
+
+                            # Skip very short extracted names (≤3 chars) to avoid false matches
+                            # Example: "Kommentarer fra I" would incorrectly match "I Have No Mouth..."
+                            if len(potential_name) <= 3:
+                                continue
+
+                            # Try word-based matching for better partial matches
+                            # This helps match "Kommentarer fra Freddi Fisk" to "freddi fisk og humongous entertainment"
+                            potential_words = _normalize_words(potential_name)
+
+                            # Good match if:
+                            # - At least 2 words overlap, OR
+                            # - All words from potential_name are found in episode_name
+                            best_match = _best_word_match(
+                                potential_words, ctx,
+                                lambda score: score >= 2 or score == len(potential_words)
                             )
 
-                            if missing_intro:
-                                print(f"  ⚠️  Missing 00:00 intro chapter: {episode_title}")
-                                print(f"      Source JSON: {json_url}")
-
-                                # Add intro chapter at 00:00
-                                intro_chapter = {
-                                    'startTime': 0,
-                                    'title': 'Intro'
-                                }
-                                sorted_chapters.insert(0, intro_chapter)
-
-                            # Update chapters_data with sorted (and possibly intro-added) chapters
-                            chapters_data['chapters'] = sorted_chapters
-
-                            # Get episode cover art for image injection
-                            cover_art_url = episode_covers[item_index]
-
-                            # Get previous and next episode cover art
-                            prev_cover_url = episode_covers[item_index + 1] if item_index + 1 < len(episode_covers) else None
-                            next_cover_url = episode_covers[item_index - 1] if item_index > 0 else None
-
-                            # Inject images for standard chapters (for ALL episodes, not just local)
-                            images_injected = 0
-                            for chapter in sorted_chapters:
-                                chapter_title = chapter.get('title', '').strip()
-
-                                # Skip if chapter already has an image (including null to disable auto-matching)
-                                # You can use "img": null in chapter file to prevent auto-matching
-                                # (empty/null values are cleaned up before saving output)
-                                if 'img' in chapter:
-                                    continue
-
-                                # Normalize apostrophes for consistent matching
-                                chapter_title_normalized = chapter_title.replace('\u2019', "'")
-                                chapter_title_lower = chapter_title_normalized.lower()
-                                start_time = chapter.get('startTime', 0)
-
-                                # Match patterns for image injection
-                                image_to_inject = None
-
-                                # FIRST CHAPTER: Always gets episode cover (regardless of title)
-                                if start_time == 0 and cover_art_url:
-                                    image_to_inject = cover_art_url
-
-                                # Episode cover art patterns
-                                elif cover_art_url and (
-                                    chapter_title.startswith("Dagens") or
-                                    chapter_title_lower.startswith("idag:") or
-                                    chapter_title.startswith("Episodens") or
-                                    chapter_title == "Hva går spillet ut på?" or
-                                    chapter_title == "Har det holdt seg?" or
-                                    chapter_title == "Kommentarer fra sosiale medier" or
-                                    "fra sosiale medier" in chapter_title_lower or
-                                    "facebook" in chapter_title_lower or
-                                    "twitter" in chapter_title_lower or
-                                    "bluesky" in chapter_title_lower
-                                ):
-                                    image_to_inject = cover_art_url
-
-                                # Podcast logo patterns
-                                elif podcast_logo and "cd spill" in chapter_title_lower:
-                                    image_to_inject = podcast_logo
-
-                                # Previous episode cover art patterns
-                                elif prev_cover_url and (
-                                    "fra sist" in chapter_title_lower or
-                                    "fra forrige" in chapter_title_lower
-                                ):
-                                    image_to_inject = prev_cover_url
-
-                                # Next episode cover art patterns
-                                elif next_cover_url and (
-                                    "neste" in chapter_title_lower
-                                ):
-                                    image_to_inject = next_cover_url
-
-                                # Music and tech chapters (using episode cover for now)
-                                # TODO: Replace with dedicated images when available:
-                                #   - "Musikken" -> music note icon
-                                #   - "Tech Specs" -> technical icon
-                                elif cover_art_url and (
-                                    "musikk" in chapter_title_lower or
-                                    "tech" in chapter_title_lower
-                                ):
-                                    image_to_inject = cover_art_url
-
-                                # Cross-reference: Match chapter title against episode game names
-                                # Example: "Home Alone" chapter in OutRun episode gets Home Alone episode cover
-                                elif chapter_title_lower in episode_titles_to_covers:
-                                    image_to_inject = episode_titles_to_covers[chapter_title_lower]
-
-                                # Exact suffix matching: Chapter ends with episode name
-                                # Example: "Historien i Duke Nukem" → Duke Nukem episode
-                                # Also normalize "the " prefix for better matching
-                                # Example: "Oppsummering av Secret of Monkey Island" → "The Secret of Monkey Island"
-                                # Only normalize if result has multiple words (to avoid "the games" → "games" false matches)
-                                if not image_to_inject:
-                                    for episode_name, cover in episode_titles_to_covers.items():
-                                        if len(episode_name) <= 3:
-                                            continue
-
-                                        # Normalize episode name by removing "the " prefix
-                                        # Only if result still has multiple words (contains space)
-                                        episode_normalized = episode_name
-                                        if episode_normalized.startswith("the "):
-                                            without_the = episode_normalized[4:]
-                                            if ' ' in without_the:  # Must have at least 2 words after removing "the"
-                                                episode_normalized = without_the
-
-                                        if chapter_title_lower.endswith(episode_normalized):
-                                            image_to_inject = cover
-                                            break
-
-                                # PREFIX matching: Chapter starts with episode name
-                                # Example: "Doom II" → "Doom", "Transport Tycoon Deluxe" → "Transport Tycoon"
-                                # Choose LONGEST matching prefix to avoid false matches
-                                # (e.g., "Legend of Kyrandia" should match "the legend of kyrandia: hand of fate" not just "legend")
-                                # Also normalize "the " prefix for better matching
-                                if not image_to_inject:
-                                    best_prefix_match = None
-                                    best_prefix_length = 0
-
-                                    # Normalize chapter title by removing "the " prefix
-                                    chapter_normalized = chapter_title_lower
-                                    if chapter_normalized.startswith("the "):
-                                        chapter_normalized = chapter_normalized[4:]
-
-                                    for episode_name, cover in episode_titles_to_covers.items():
-                                        if len(episode_name) <= 3:
-                                            continue
-
-                                        # Normalize episode name by removing "the " prefix
-                                        episode_normalized = episode_name
-                                        if episode_normalized.startswith("the "):
-                                            episode_normalized = episode_normalized[4:]
-
-                                        # Check if chapter starts with episode name (using normalized versions)
-                                        if chapter_normalized.startswith(episode_normalized):
-                                            # Keep the longest match (use normalized length for comparison)
-                                            if len(episode_normalized) > best_prefix_length:
-                                                best_prefix_match = cover
-                                                best_prefix_length = len(episode_normalized)
-
-                                    if best_prefix_match:
-                                        image_to_inject = best_prefix_match
-
-                                # Reverse PREFIX matching: Episode name starts with chapter
-                                # Example: "Backpacker" → "Backpacker 2"
-                                # Choose LONGEST matching episode name to avoid false matches
-                                if not image_to_inject:
-                                    best_reverse_match = None
-                                    best_reverse_length = 0
-
-                                    for episode_name, cover in episode_titles_to_covers.items():
-                                        if len(chapter_title_lower) > 3 and episode_name.startswith(chapter_title_lower):
-                                            # Keep the longest episode name match
-                                            if len(episode_name) > best_reverse_length:
-                                                best_reverse_match = cover
-                                                best_reverse_length = len(episode_name)
-
-                                    if best_reverse_match:
-                                        image_to_inject = best_reverse_match
-
-                                # "I forhold til [game]" - cross-reference to that game's episode
-                                if not image_to_inject and "i forhold til" in chapter_title_lower:
-                                    game_name = chapter_title_lower.split("i forhold til", 1)[1].strip()
-                                    if game_name in episode_titles_to_covers:
-                                        image_to_inject = episode_titles_to_covers[game_name]
-
-                                # "Ligner på [game]" - cross-reference to that game's episode
-                                if not image_to_inject and "ligner på" in chapter_title_lower:
-                                    game_name = chapter_title_lower.split("ligner på", 1)[1].strip()
-                                    if game_name in episode_titles_to_covers:
-                                        image_to_inject = episode_titles_to_covers[game_name]
-
-                                # CONTAINS matching for "Mer [game]" pattern
-                                # Example: "Mer Warcraft II" → contains "warcraft"
-                                if not image_to_inject and chapter_title_lower.startswith("mer "):
-                                    for episode_name, cover in episode_titles_to_covers.items():
-                                        if len(episode_name) > 3 and episode_name in chapter_title_lower:
-                                            image_to_inject = cover
-                                            break
-
-                                # "Kommentarer fra [episode]" - match episode name (not previous, not social media)
-                                if not image_to_inject and chapter_title_lower.startswith("kommentarer fra "):
-                                    # Skip if it's social media or previous episode (already handled above)
-                                    if not any(x in chapter_title_lower for x in ["sosiale medier", "forrige", "sist", "facebook", "twitter", "bluesky"]):
-                                        # Extract potential episode name
-                                        potential_name = chapter_title_lower.replace("kommentarer fra ", "").strip()
-
-                                        # Skip very short extracted names (≤3 chars) to avoid false matches
-                                        # Example: "Kommentarer fra I" would incorrectly match "I Have No Mouth..."
-                                        if len(potential_name) <= 3:
-                                            continue
-
-                                        # Try word-based matching for better partial matches
-                                        # This helps match "Kommentarer fra Freddi Fisk" to "freddi fisk og humongous entertainment"
-                                        potential_words = normalize_words(potential_name)
-
-                                        best_match = None
-                                        best_match_score = 0
-
-                                        for episode_name, cover in episode_titles_to_covers.items():
-                                            if len(episode_name) <= 3:  # Skip very short episode names
-                                                continue
-
-                                            episode_words = normalize_words(episode_name)
-                                            common_words = potential_words & episode_words
-
-                                            # Calculate match score: number of overlapping words
-                                            match_score = len(common_words)
-
-                                            # Good match if:
-                                            # - At least 2 words overlap, OR
-                                            # - All words from potential_name are found in episode_name
-                                            if match_score >= 2 or (len(potential_words) > 0 and match_score == len(potential_words)):
-                                                if match_score > best_match_score:
-                                                    best_match = cover
-                                                    best_match_score = match_score
-
-                                        if best_match:
-                                            image_to_inject = best_match
-
-                                # Fuzzy word-based matching as last resort for multi-word titles
-                                # Example: "Heroes of Might and Magic" → "Heroes of Might & Magic"
-                                if not image_to_inject:
-                                    chapter_words = normalize_words(chapter_title_lower)
-
-                                    # Only apply to chapters with at least 3 words to avoid false positives
-                                    if len(chapter_words) >= 3:
-                                        best_match = None
-                                        best_match_score = 0
-
-                                        for episode_name, cover in episode_titles_to_covers.items():
-                                            if len(episode_name) <= 3:
-                                                continue
-
-                                            episode_words = normalize_words(episode_name)
-                                            common_words = chapter_words & episode_words
-                                            match_score = len(common_words)
-
-                                            # Strong match if most words overlap (at least 80% of chapter words)
-                                            if len(chapter_words) > 0 and match_score >= len(chapter_words) * 0.8:
-                                                if match_score > best_match_score:
-                                                    best_match = cover
-                                                    best_match_score = match_score
-
-                                        if best_match:
-                                            image_to_inject = best_match
-
-                                # Inject the image
-                                if image_to_inject:
-                                    chapter['img'] = image_to_inject
-                                    images_injected += 1
-
-                            # Clean up empty img fields before saving (both "" and null)
-                            # This follows Podbean's practice of omitting the field entirely
-                            for chapter in sorted_chapters:
-                                if 'img' in chapter and not chapter['img']:
-                                    del chapter['img']
-
-                            # Save enriched JSON to output directory (for ALL episodes)
-                            output_file = os.path.join(output_dir, filename)
-                            with open(output_file, 'w', encoding='utf-8') as f:
-                                json.dump(chapters_data, f, indent=2, ensure_ascii=False)
-
-                            # Update podcast:chapters URL to point to our hosted version (for ALL episodes)
-                            new_url = f"{base_url}/{filename}"
-                            podcast_chapters.set('url', new_url)
-
-                        if include_psc_tags:
-                            # Create PSC chapters element
-                            psc_chapters = etree.Element(
-                                f'{{{psc_ns}}}chapters',
-                                version="1.2"
+                            if best_match:
+                                image_to_inject = best_match
+
+                    # Fuzzy word-based matching as last resort for multi-word titles
+                    # Example: "Heroes of Might and Magic" → "Heroes of Might & Magic"
+                    if not image_to_inject:
+                        chapter_words = _normalize_words(chapter_title_lower)
+
+                        # Only apply to chapters with at least 3 words to avoid false positives
+                        if len(chapter_words) >= 3:
+                            # Strong match if most words overlap (at least 80% of chapter words)
+                            best_match = _best_word_match(
+                                chapter_words, ctx,
+                                lambda score: score >= len(chapter_words) * 0.8
                             )
 
-                            # Convert chapters to PSC format (chapters are already sorted and have intro)
-                            if 'chapters' in chapters_data:
-                                # Use the already processed chapters from chapters_data
-                                processed_chapters = chapters_data['chapters']
-
-                                for chapter in processed_chapters:
-                                    # Skip hidden chapters (toc: false)
-                                    if chapter.get('toc', True) is False:
-                                        continue
-
-                                    start_time = chapter.get('startTime', 0)
-                                    title = chapter.get('title', '')
-
-                                    # Convert seconds to HH:MM:SS format
-                                    hours = int(start_time // 3600)
-                                    minutes = int((start_time % 3600) // 60)
-                                    seconds = int(start_time % 60)
-                                    time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-                                    # Create chapter element
-                                    attrs = {
-                                        'start': time_str,
-                                        'title': title
-                                    }
-
-                                    # Add optional attributes
-                                    if 'url' in chapter:
-                                        attrs['href'] = chapter['url']
-                                    # Only add image if it has a non-empty value
-                                    # (null or "" in source file disables auto-matching; cleaned up before PSC)
-                                    if 'img' in chapter and chapter['img']:
-                                        attrs['image'] = chapter['img']
-
-                                    psc_chapter = etree.SubElement(
-                                        psc_chapters,
-                                        f'{{{psc_ns}}}chapter',
-                                        **attrs
-                                    )
-
-                                # Add PSC chapters to item (after podcast:chapters)
-                                chapter_index = list(item).index(podcast_chapters)
-                                item.insert(chapter_index + 1, psc_chapters)
-
-                                # Add newline before psc:chapters for better readability
-                                self._add_newline_before_element(item, psc_chapters)
-
-                                converted_count += 1
-                        else:
-                            # URL rewrite + hosted JSON only; no PSC tags in output
-                            converted_count += 1
+                            if best_match:
+                                image_to_inject = best_match
+
+                    # Inject the image
+                    if image_to_inject:
+                        chapter['img'] = image_to_inject
+                        images_injected += 1
+
+                # Clean up empty img fields before saving (both "" and null)
+                # This follows Podbean's practice of omitting the field entirely
+                for chapter in sorted_chapters:
+                    if 'img' in chapter and not chapter['img']:
+                        del chapter['img']
+
+                # Save enriched JSON to output directory (for ALL episodes)
+                output_file = os.path.join(output_dir, filename)
+                # Serialize in one go and write once; json.dump() would issue a
+                # separate write() for every encoded chunk
+                payload = json.dumps(chapters_data, indent=2, ensure_ascii=False)
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+
+                # Update podcast:chapters URL to point to our hosted version (for ALL episodes)
+                new_url = f"{base_url}/{filename}"
+                podcast_chapters.set('url', new_url)
+
+            if include_psc_tags:
+                # Create PSC chapters element
+                psc_chapters = etree.Element(
+                    _PSC_CHAPTERS_TAG,
+                    nsmap=ctx['psc_nsmap'],
+                    version="1.2"
+                )
 
-                    except Exception as e:
-                        failed_count += 1
-                        # Silently skip episodes with failed chapter conversions
-                        continue
+                # Convert chapters to PSC format (chapters are already sorted and have intro)
+                if 'chapters' in chapters_data:
+                    # Use the already processed chapters from chapters_data
+                    processed_chapters = chapters_data['chapters']
+
+                    for chapter in processed_chapters:
+                        # Skip hidden chapters (toc: false)
+                        if chapter.get('toc', True) is False:
+                            continue
+
+                        start_time = chapter.get('startTime', 0)
+                        title = chapter.get('title', '')
+
+                        # Convert seconds to HH:MM:SS format
+                        minutes, seconds = divmod(int(start_time), 60)
+                        hours, minutes = divmod(minutes, 60)
+
+                        # Create chapter element
+                        attrs = {
+                            'start': "%02d:%02d:%02d" % (hours, minutes, seconds),
+                            'title': title
+                        }
 
-        if include_psc_tags:
-            print(f"✓ Converted {converted_count} JSON chapters to Podlove Simple Chapters format")
+                        # Add optional attributes
+                        if 'url' in chapter:
+                            attrs['href'] = chapter['url']
+                        # Only add image if it has a non-empty value
+                        # (null or "" in source file disables auto-matching; cleaned up before PSC)
+                        if 'img' in chapter and chapter['img']:
+                            attrs['image'] = chapter['img']
+
+                        etree.SubElement(psc_chapters, _PSC_CHAPTER_TAG, attrs)
+
+                    # Add PSC chapters to item (after podcast:chapters)
+                    podcast_chapters.addnext(psc_chapters)
+
+                    # Add newline before psc:chapters for better readability
+                    self._add_newline_before_element(item, psc_chapters)
+
+                    ctx['converted_count'] += 1
+            else:
+                # URL rewrite + hosted JSON only; no PSC tags in output
+                ctx['converted_count'] += 1
+
+        except Exception as e:
+            # Silently skip episodes with failed chapter conversions
+            ctx['failed_count'] += 1
+
+    def _register_psc_namespace(self) -> None:
+        """
+        Declare the psc prefix on the root element.
+
+        Moves the declarations made on the individual psc:chapters elements up to
+        the root in one C-level pass. Every prefix declared anywhere in the feed
+        is kept, so unused declarations on other elements (e.g. xmlns:media on an
+        item) are left as they were.
+        """
+        keep_prefixes = {
+            prefix for elem in self.root.iter(etree.Element) for prefix in elem.nsmap if prefix
+        }
+        etree.cleanup_namespaces(
+            self.root, top_nsmap={'psc': PSC_NS}, keep_ns_prefixes=keep_prefixes
+        )
+
+    def _report_chapter_conversion(self, ctx: Dict) -> None:
+        """Print the chapter conversion summary and warn about unused local files."""
+        if ctx['warnings']:
+            print('\n'.join(ctx['warnings']))
+
+        if ctx['include_psc_tags']:
+            print(f"✓ Converted {ctx['converted_count']} JSON chapters to Podlove Simple Chapters format")
         else:
-            print(f"✓ Hosted {converted_count} chapter JSON files and rewrote podcast:chapters URLs")
-        if local_count > 0:
-            print(f"  📁 {local_count} from local files (with toc: false support)")
-        if failed_count > 0:
-            print(f"  ⚠ {failed_count} episodes failed to convert (JSON not accessible)")
+            print(f"✓ Hosted {ctx['converted_count']} chapter JSON files and rewrote podcast:chapters URLs")
+        if ctx['local_count'] > 0:
+            print(f"  📁 {ctx['local_count']} from local files (with toc: false support)")
+        if ctx['failed_count'] > 0:
+            print(f"  ⚠ {ctx['failed_count']} episodes failed to convert (JSON not accessible)")
 
         # Check for unused local chapter files
+        chapters_dir = ctx['chapters_dir']
         if os.path.exists(chapters_dir):
-            all_local_files = set()
-            for filename in os.listdir(chapters_dir):
-                if filename.endswith('.json') and not filename.startswith('.'):
-                    all_local_files.add(filename)
+            with os.scandir(chapters_dir) as entries:
+                all_local_files = {
+                    entry.name for entry in entries
+                    if entry.name.endswith('.json') and not entry.name.startswith('.')
+                }
 
-            unused_files = all_local_files - used_local_files
+            unused_files = all_local_files - ctx['used_local_files']
             if unused_files:
                 print(f"  ⚠️  Found {len(unused_files)} unused chapter file(s) in {chapters_dir}/")
                 for filename in sorted(unused_files):
                     print(f"      - {filename} (check filename matches Podbean URL)")
 
-        return self
-
     def format_podcast_elements(self) -> 'FeedEnricher':
         """
         Format podcast elements for better readability.
@@ -1389,28 +2058,19 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
+        return self.apply_all(
+            convert_chapters=False,
+            format_elements=True,
+            restore_numbers=False,
+            chapter_desc=False,
+        )
 
-        items = self.channel.findall('item')
-        for item in items:
-            # Add newline before all podcast:season elements
-            seasons = item.findall('{https://podcastindex.org/namespace/1.0}season')
-            for season in seasons:
-                self._add_newline_before_element(item, season)
-
-            # Add newline before all podcast:episode elements
-            episodes = item.findall('{https://podcastindex.org/namespace/1.0}episode')
-            for episode in episodes:
-                self._add_newline_before_element(item, episode)
-
-            # Add newline before all podcast:person elements
-            persons = item.findall('{https://podcastindex.org/namespace/1.0}person')
-            for person in persons:
-                self._add_newline_before_element(item, person)
-
-        print("✓ Formatted podcast elements for better readability")
-        return self
+    def _format_podcast_elements_one(self, item: etree._Element) -> None:
+        """Add newlines before the podcast:season/episode/person elements of one item."""
+        # One lazy walk over the children; each element only touches the tail
+        # of its own previous sibling, so the order they come in doesn't matter
+        for elem in item.iterchildren(_SEASON_TAG, _EPISODE_TAG, _PERSON_TAG):
+            self._add_newline_before_element(item, elem)
 
     def _format_youtube_timestamp(self, time_str: str) -> str:
         """
@@ -1449,7 +2109,8 @@ class FeedEnricher(BaseFeed):
 
         This is useful for feeds like YouTube that display episode numbers differently
         than podcast apps. Skips bonus episodes (episodeType=bonus) as they should
-        not have episode numbers in titles.
+        not have episode numbers in titles. Each title is only updated once, so
+        calling this again is a no-op.
 
         Args:
             format: Format string with {episode} placeholder (default: ' (#{episode})')
@@ -1457,42 +2118,51 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
-
-        items = self.channel.findall('item')
-        restored_count = 0
-        skipped_bonus = 0
-
-        for item in items:
-            # Skip bonus episodes (they should not have episode numbers in titles)
-            episode_type = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}episodeType')
-            if episode_type is not None and episode_type.text == 'bonus':
-                skipped_bonus += 1
-                continue
-
-            episode_elem = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}episode')
-            if episode_elem is None or not episode_elem.text:
-                continue
-
-            episode_num = episode_elem.text.strip()
-            suffix = format.format(episode=episode_num)
-
-            # Update <title>
-            title_elem = item.find('title')
-            if title_elem is not None and title_elem.text:
-                if suffix not in title_elem.text:  # Avoid duplicates
-                    title_elem.text = title_elem.text + suffix
-                    restored_count += 1
+        return self.apply_all(
+            convert_chapters=False,
+            format_elements=False,
+            restore_numbers=True,
+            chapter_desc=False,
+            title_format=format,
+        )
 
-            # Update <itunes:title> if present
-            itunes_title = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}title')
-            if itunes_title is not None and itunes_title.text:
-                if suffix not in itunes_title.text:
-                    itunes_title.text = itunes_title.text + suffix
+    def _restore_episode_number_one(self, item: etree._Element, format: str) -> Optional[bool]:
+        """
+        Append the episode number to the titles of a single item.
 
-        print(f"✓ Restored episode numbers to {restored_count} episode titles (skipped {skipped_bonus} bonus episodes)")
-        return self
+        Returns:
+            True if <title> was updated, False if not, None for skipped bonus episodes
+        """
+        # Skip bonus episodes (they should not have episode numbers in titles)
+        episode_type = _first(_FIND_ITUNES_EPISODE_TYPE(item))
+        if episode_type is not None and episode_type.text == 'bonus':
+            return None
+
+        episode_elem = _first(_FIND_ITUNES_EPISODE(item))
+        if episode_elem is None or not episode_elem.text:
+            return False
+
+        episode_num = episode_elem.text.strip()
+        suffix = format.format(episode=episode_num)
+        restored = False
+
+        # Update <title>
+        title_elem = item.find('title')
+        if title_elem is not None and title_elem.text:
+            # Avoid duplicates: restored earlier in this run, or already numbered
+            if title_elem not in self._restored_titles and not title_elem.text.endswith(suffix):
+                title_elem.text = title_elem.text + suffix
+                restored = True
+            self._restored_titles.add(title_elem)
+
+        # Update <itunes:title> if present
+        itunes_title = _first(_FIND_ITUNES_TITLE(item))
+        if itunes_title is not None and itunes_title.text:
+            if itunes_title not in self._restored_titles and not itunes_title.text.endswith(suffix):
+                itunes_title.text = itunes_title.text + suffix
+            self._restored_titles.add(itunes_title)
+
+        return restored
 
     def add_description_footer(
         self,
@@ -1523,7 +2193,6 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        items = self.channel.findall('item')
         article_count = 0
         footer_count = 0
 
@@ -1545,20 +2214,18 @@ class FeedEnricher(BaseFeed):
 
         social_footer = "<br>\n".join(social_parts)
 
-        for item in items:
+        for item in self.channel.iterchildren('item'):
             footer_parts = []
 
             # Check if <link> matches the article domain
             if episode_article_domain and episode_article_prefix:
-                link_elem = item.find('link')
-                if link_elem is not None and link_elem.text:
-                    link_url = link_elem.text.strip()
-                    if episode_article_domain in link_url:
-                        footer_parts.append(
-                            f"<p>{episode_article_prefix} "
-                            f"<a href='{link_url}'>{episode_article_text}</a>.</p>"
-                        )
-                        article_count += 1
+                link_url = (item.findtext('link') or '').strip()
+                if link_url and episode_article_domain in link_url:
+                    footer_parts.append(
+                        f"<p>{episode_article_prefix} "
+                        f"<a href='{link_url}'>{episode_article_text}</a>.</p>"
+                    )
+                    article_count += 1
 
             if social_footer:
                 footer_parts.append(f"<p>{social_footer}</p>")
@@ -1574,7 +2241,7 @@ class FeedEnricher(BaseFeed):
                 desc_elem.text = desc_elem.text.rstrip() + "\n\n" + footer_html
 
             # Update <content:encoded>
-            content_elem = item.find('{http://purl.org/rss/1.0/modules/content/}encoded')
+            content_elem = item.find(_CONTENT_ENCODED_TAG)
             if content_elem is not None and content_elem.text:
                 content_elem.text = content_elem.text.rstrip() + "\n\n" + footer_html
 
@@ -1604,65 +2271,20 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        from html.parser import HTMLParser
-
-        class ParagraphExtractor(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.paragraphs = []
-                self.current_text = ''
-                self.in_p = False
-
-            def handle_starttag(self, tag, attrs):
-                if tag == 'p':
-                    self.in_p = True
-                    self.current_text = ''
-
-            def handle_endtag(self, tag):
-                if tag == 'p' and self.in_p:
-                    text = self.current_text.strip()
-                    if text:
-                        self.paragraphs.append(text)
-                    self.in_p = False
-
-            def handle_data(self, data):
-                if self.in_p:
-                    self.current_text += data
-
-            def handle_entityref(self, name):
-                entities = {
-                    'aring': 'å', 'oslash': 'ø', 'aelig': 'æ',
-                    'Aring': 'Å', 'Oslash': 'Ø', 'Aelig': 'Æ',
-                    'amp': '&', 'nbsp': ' ',
-                }
-                char = entities.get(name, f'&{name};')
-                if self.in_p:
-                    self.current_text += char
-
-        itunes_ns = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
-        content_ns = 'http://purl.org/rss/1.0/modules/content/'
-        items = self.channel.findall('item')
         updated_count = 0
 
-        for item in items:
-            summary_elem = item.find(f'{{{itunes_ns}}}summary')
+        for item in self.channel.iterchildren('item'):
+            summary_elem = item.find(_ITUNES_SUMMARY_TAG)
             if summary_elem is None:
                 continue
 
             # Get HTML description
-            content_elem = item.find(f'{{{content_ns}}}encoded')
-            desc_elem = item.find('description')
-            html = ''
-            if content_elem is not None and content_elem.text:
-                html = content_elem.text
-            elif desc_elem is not None and desc_elem.text:
-                html = desc_elem.text
-
+            html = item.findtext(_CONTENT_ENCODED_TAG) or item.findtext('description')
             if not html:
                 continue
 
             # Extract paragraphs
-            parser = ParagraphExtractor()
+            parser = _ParagraphExtractor()
             parser.feed(html)
 
             if not parser.paragraphs:
@@ -1701,17 +2323,16 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        itunes_ns = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
         removed = 0
 
         if include_channel:
-            channel_summary = self.channel.find(f'{{{itunes_ns}}}summary')
+            channel_summary = self.channel.find(_ITUNES_SUMMARY_TAG)
             if channel_summary is not None:
                 self.channel.remove(channel_summary)
                 removed += 1
 
-        for item in self.channel.findall('item'):
-            summary = item.find(f'{{{itunes_ns}}}summary')
+        for item in self.channel.iterchildren('item'):
+            summary = item.find(_ITUNES_SUMMARY_TAG)
             if summary is not None:
                 item.remove(summary)
                 removed += 1
@@ -1734,11 +2355,10 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        content_ns = 'http://purl.org/rss/1.0/modules/content/'
         removed = 0
 
-        for item in self.channel.findall('item'):
-            content = item.find(f'{{{content_ns}}}encoded')
+        for item in self.channel.iterchildren('item'):
+            content = item.find(_CONTENT_ENCODED_TAG)
             if content is not None:
                 item.remove(content)
                 removed += 1
@@ -1770,10 +2390,9 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        items = self.channel.findall('item')
         updated = 0
 
-        for item in items:
+        for item in self.channel.iterchildren('item'):
             touched = False
 
             desc = item.find('description')
@@ -1781,12 +2400,12 @@ class FeedEnricher(BaseFeed):
                 desc.text = desc.text.rstrip() + f"\n\n{description_marker}"
                 touched = True
 
-            content = item.find('{http://purl.org/rss/1.0/modules/content/}encoded')
+            content = item.find(_CONTENT_ENCODED_TAG)
             if content is not None and content.text:
                 content.text = content.text.rstrip() + f"\n\n{content_marker}"
                 touched = True
 
-            summary = item.find('{http://www.itunes.com/dtds/podcast-1.0.dtd}summary')
+            summary = item.find(_ITUNES_SUMMARY_TAG)
             if summary is not None and summary.text:
                 summary.text = summary.text.rstrip() + f" {summary_marker}"
                 touched = True
@@ -1812,55 +2431,59 @@ class FeedEnricher(BaseFeed):
         Returns:
             Self for chaining
         """
-        if self.channel is None:
-            raise ValueError("Must fetch feed first")
-
-        psc_ns = "http://podlove.org/simple-chapters"
-        items = self.channel.findall('item')
-        updated_count = 0
+        return self.apply_all(
+            convert_chapters=False,
+            format_elements=False,
+            restore_numbers=False,
+            chapter_desc=True,
+            separator=separator,
+        )
 
-        for item in items:
-            # Find psc:chapters element (must be present from convert_json_chapters_to_psc)
-            psc_chapters = item.find(f'{{{psc_ns}}}chapters')
-            if psc_chapters is None:
-                continue
+    def _add_chapter_timestamps_one(self, item: etree._Element, separator: str) -> bool:
+        """
+        Append the psc:chapters timestamps to the descriptions of a single item.
 
-            # Extract all chapter elements
-            chapters = psc_chapters.findall(f'{{{psc_ns}}}chapter')
-            if not chapters:
-                continue
+        Returns:
+            True if the item had chapters to add
+        """
+        # Find psc:chapters element (must be present from convert_json_chapters_to_psc)
+        psc_chapters = _first(_FIND_PSC_CHAPTERS(item))
+        if psc_chapters is None:
+            return False
 
-            # Build timestamp text block
-            timestamp_lines = []
-            for chapter in chapters:
-                start_time = chapter.get('start', '00:00:00')
-                title = chapter.get('title', '')
+        # Extract all chapter elements
+        chapters = _FIND_PSC_CHAPTER_LIST(psc_chapters)
+        if not chapters:
+            return False
 
-                # Convert to YouTube format (e.g., "0:00", "12:34", "1:23:45")
-                youtube_time = self._format_youtube_timestamp(start_time)
-                timestamp_lines.append(f"{youtube_time} {title}")
+        # Build timestamp text block
+        timestamp_lines = []
+        for chapter in chapters:
+            start_time = chapter.get('start', '00:00:00')
+            title = chapter.get('title', '')
 
-            if not timestamp_lines:
-                continue
+            # Convert to YouTube format (e.g., "0:00", "12:34", "1:23:45")
+            youtube_time = self._format_youtube_timestamp(start_time)
+            timestamp_lines.append(f"{youtube_time} {title}")
 
-            timestamp_text = '\n'.join(timestamp_lines)
+        if not timestamp_lines:
+            return False
 
-            # Update <description>
-            desc_elem = item.find('description')
-            if desc_elem is not None and desc_elem.text:
-                if timestamp_text not in desc_elem.text:
-                    desc_elem.text = desc_elem.text + separator + timestamp_text
+        timestamp_text = '\n'.join(timestamp_lines)
 
-            # Update <content:encoded>
-            content_elem = item.find('{http://purl.org/rss/1.0/modules/content/}encoded')
-            if content_elem is not None and content_elem.text:
-                if timestamp_text not in content_elem.text:
-                    content_elem.text = content_elem.text + separator + timestamp_text
+        # Update <description>
+        desc_elem = item.find('description')
+        if desc_elem is not None and desc_elem.text:
+            if timestamp_text not in desc_elem.text:
+                desc_elem.text = desc_elem.text + separator + timestamp_text
 
-            updated_count += 1
+        # Update <content:encoded>
+        content_elem = item.find(_CONTENT_ENCODED_TAG)
+        if content_elem is not None and content_elem.text:
+            if timestamp_text not in content_elem.text:
+                content_elem.text = content_elem.text + separator + timestamp_text
 
-        print(f"✓ Added chapter timestamps to {updated_count} episode descriptions")
-        return self
+        return True
 
     def remove_chapter_tags(
         self,
@@ -1878,38 +2501,160 @@ class FeedEnricher(BaseFeed):
             remove_podcast: If True, remove <podcast:chapters> elements
             remove_psc: If True, remove <psc:chapters> elements
 
+        Returns:
+            Self for chaining
+        """
+        return self.apply_all(
+            convert_chapters=False,
+            format_elements=False,
+            restore_numbers=False,
+            chapter_desc=False,
+            remove_chapters=True,
+            remove_podcast=remove_podcast,
+            remove_psc=remove_psc,
+        )
+
+    def apply_all(
+        self,
+        *,
+        convert_chapters: bool = True,
+        format_elements: bool = True,
+        restore_numbers: bool = True,
+        chapter_desc: bool = True,
+        remove_chapters: bool = False,
+        chapters_dir: str = "chapters",
+        output_dir: str = "output/chapters",
+        base_url: str = "https://mrmamen.github.io/podcast-feed-updater/chapters",
+        include_psc_tags: bool = True,
+        title_format: str = ' (#{episode})',
+        separator: str = '\n\n',
+        remove_podcast: bool = True,
+        remove_psc: bool = True,
+    ) -> 'FeedEnricher':
+        """
+        Run the per-item chapter and title passes in a single walk over the items.
+
+        Equivalent to calling restore_episode_numbers_to_titles(),
+        convert_json_chapters_to_psc(), add_chapter_timestamps_to_description(),
+        remove_chapter_tags() and format_podcast_elements() in that order, but
+        each item's children are visited once instead of once per method. When
+        titles are restored and chapters converted together, the titles are
+        restored in a short pass first, so chapter cover matching sees the
+        restored titles just as the chained calls would.
+
+        Args:
+            convert_chapters: Run convert_json_chapters_to_psc()
+            format_elements: Run format_podcast_elements()
+            restore_numbers: Run restore_episode_numbers_to_titles()
+            chapter_desc: Run add_chapter_timestamps_to_description()
+            remove_chapters: Run remove_chapter_tags()
+            chapters_dir, output_dir, base_url, include_psc_tags: Passed to the chapter conversion
+            title_format: Format string for restored episode numbers
+            separator: Separator before chapter timestamps in descriptions
+            remove_podcast, remove_psc: Which chapter tags to remove
+
         Returns:
             Self for chaining
         """
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        podcast_ns = 'https://podcastindex.org/namespace/1.0'
-        psc_ns = "http://podlove.org/simple-chapters"
+        # Skip the chapter passes on feeds without chapter tags (a single
+        # find() stops at the first match, or exhausts quickly)
+        has_podcast_chapters = self.channel.find(_ITEM_PODCAST_CHAPTERS_PATH) is not None
+        if convert_chapters and not has_podcast_chapters:
+            print("✓ No podcast:chapters present, skipping chapter conversion")
+            convert_chapters = False
+
+        # Converting in the same walk creates psc:chapters, so only probe without it
+        has_psc_chapters = convert_chapters and include_psc_tags
+        if not has_psc_chapters:
+            has_psc_chapters = self.channel.find(_ITEM_PSC_CHAPTERS_PATH) is not None
+        if chapter_desc and not has_psc_chapters:
+            print("✓ No psc:chapters present, skipping chapter timestamps")
+            chapter_desc = False
+        if remove_chapters and not (
+            (remove_podcast and has_podcast_chapters) or (remove_psc and has_psc_chapters)
+        ):
+            print("✓ No chapter tags present, skipping removal")
+            remove_chapters = False
+
         items = self.channel.findall('item')
 
+        restored_count = 0
+        skipped_bonus = 0
+
+        # The chapter cover index is built from the titles, so restore them first
+        restore_in_walk = restore_numbers
+        if restore_numbers and convert_chapters:
+            for item in items:
+                restored = self._restore_episode_number_one(item, title_format)
+                if restored is None:
+                    skipped_bonus += 1
+                elif restored:
+                    restored_count += 1
+            print(f"✓ Restored episode numbers to {restored_count} episode titles (skipped {skipped_bonus} bonus episodes)")
+            restore_in_walk = False
+
+        chapter_ctx = None
+        if convert_chapters:
+            chapter_ctx = self._prepare_chapter_conversion(
+                items, chapters_dir, output_dir, base_url, include_psc_tags
+            )
+
+        updated_count = 0
         removed_podcast_chapters = 0
         removed_psc_chapters = 0
 
-        for item in items:
-            if remove_podcast:
-                podcast_chapters = item.find(f'{{{podcast_ns}}}chapters')
-                if podcast_chapters is not None:
-                    item.remove(podcast_chapters)
-                    removed_podcast_chapters += 1
+        for item_index, item in enumerate(items):
+            if restore_in_walk:
+                restored = self._restore_episode_number_one(item, title_format)
+                if restored is None:
+                    skipped_bonus += 1
+                elif restored:
+                    restored_count += 1
+
+            if convert_chapters:
+                self._convert_chapters_one(item, item_index, chapter_ctx)
+
+            if chapter_desc and self._add_chapter_timestamps_one(item, separator):
+                updated_count += 1
 
+            if remove_chapters:
+                if remove_podcast:
+                    podcast_chapters = _first(_FIND_PODCAST_CHAPTERS(item))
+                    if podcast_chapters is not None:
+                        item.remove(podcast_chapters)
+                        removed_podcast_chapters += 1
+
+                if remove_psc:
+                    psc_chapters = _first(_FIND_PSC_CHAPTERS(item))
+                    if psc_chapters is not None:
+                        item.remove(psc_chapters)
+                        removed_psc_chapters += 1
+
+            if format_elements:
+                self._format_podcast_elements_one(item)
+
+        if convert_chapters and chapter_ctx['psc_nsmap'] and chapter_ctx['converted_count']:
+            self._register_psc_namespace()
+
+        if restore_in_walk:
+            print(f"✓ Restored episode numbers to {restored_count} episode titles (skipped {skipped_bonus} bonus episodes)")
+        if convert_chapters:
+            self._report_chapter_conversion(chapter_ctx)
+        if chapter_desc:
+            print(f"✓ Added chapter timestamps to {updated_count} episode descriptions")
+        if remove_chapters:
+            parts = []
+            if remove_podcast:
+                parts.append(f"{removed_podcast_chapters} podcast:chapters")
             if remove_psc:
-                psc_chapters = item.find(f'{{{psc_ns}}}chapters')
-                if psc_chapters is not None:
-                    item.remove(psc_chapters)
-                    removed_psc_chapters += 1
-
-        parts = []
-        if remove_podcast:
-            parts.append(f"{removed_podcast_chapters} podcast:chapters")
-        if remove_psc:
-            parts.append(f"{removed_psc_chapters} psc:chapters")
-        print(f"✓ Removed {' and '.join(parts)} tags")
+                parts.append(f"{removed_psc_chapters} psc:chapters")
+            print(f"✓ Removed {' and '.join(parts)} tags")
+        if format_elements:
+            print("✓ Formatted podcast elements for better readability")
+
         return self
 
     def update_atom_link(self, url: str) -> 'FeedEnricher':
@@ -1929,10 +2674,8 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        atom_ns = '{http://www.w3.org/2005/Atom}'
-
         # Find atom:link with rel="self"
-        for link in self.channel.findall(f'{atom_ns}link'):
+        for link in self.channel.findall(_ATOM_LINK_TAG):
             if link.get('rel') == 'self':
                 old_url = link.get('href')
                 link.set('href', url)
@@ -1941,7 +2684,7 @@ class FeedEnricher(BaseFeed):
 
         # If no atom:link exists, create one
         atom_link = etree.Element(
-            f'{atom_ns}link',
+            _ATOM_LINK_TAG,
             href=url,
             rel='self',
             type='application/rss+xml'
@@ -1949,8 +2692,7 @@ class FeedEnricher(BaseFeed):
         # Insert after title
         title = self.channel.find('title')
         if title is not None:
-            title_idx = list(self.channel).index(title)
-            self.channel.insert(title_idx + 1, atom_link)
+            title.addnext(atom_link)
             print(f"✓ Added atom:link: {url}")
         else:
             self.channel.insert(0, atom_link)
@@ -1983,8 +2725,7 @@ class FeedEnricher(BaseFeed):
             # Insert after pubDate if it exists
             pubdate = self.channel.find('pubDate')
             if pubdate is not None:
-                pubdate_idx = list(self.channel).index(pubdate)
-                self.channel.insert(pubdate_idx + 1, generator)
+                pubdate.addnext(generator)
             else:
                 self.channel.append(generator)
             print(f"✓ Added generator: '{text}'")
@@ -2004,14 +2745,8 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        from datetime import datetime, timezone, timedelta
-        from email.utils import format_datetime
-
         # Generate RFC 2822 formatted date with Norwegian timezone (+0100)
-        # This ensures consistency with pubDate regardless of where the script runs
-        norway_tz = timezone(timedelta(hours=1))
-        now = datetime.now(norway_tz)
-        timestamp = format_datetime(now)
+        timestamp = format_datetime(datetime.now(NORWAY_TZ))
 
         lastbuilddate = self.channel.find('lastBuildDate')
         if lastbuilddate is not None:
@@ -2024,13 +2759,11 @@ class FeedEnricher(BaseFeed):
             # Insert after generator if it exists, otherwise after pubDate
             generator = self.channel.find('generator')
             if generator is not None:
-                generator_idx = list(self.channel).index(generator)
-                self.channel.insert(generator_idx + 1, lastbuilddate)
+                generator.addnext(lastbuilddate)
             else:
                 pubdate = self.channel.find('pubDate')
                 if pubdate is not None:
-                    pubdate_idx = list(self.channel).index(pubdate)
-                    self.channel.insert(pubdate_idx + 1, lastbuilddate)
+                    pubdate.addnext(lastbuilddate)
                 else:
                     self.channel.append(lastbuilddate)
             print(f"✓ Added lastBuildDate: {timestamp}")
@@ -2052,9 +2785,6 @@ class FeedEnricher(BaseFeed):
         if self.channel is None:
             raise ValueError("Must fetch feed first")
 
-        from datetime import timedelta
-        from email.utils import parsedate_to_datetime, format_datetime
-
         newest_item = self.channel.find('item')
         pubdate_elem = newest_item.find('pubDate') if newest_item is not None else None
         if pubdate_elem is None or not pubdate_elem.text:
@@ -2067,12 +2797,13 @@ class FeedEnricher(BaseFeed):
         print(f"✓ Shifted newest episode pubDate by {hours}h: {original} → {shifted}")
         return self
 
-    def write_feed(self, output_file: str) -> None:
+    def write_feed(self, output_file: str, compression: int = 0) -> None:
         """
         Write enriched feed to file.
 
         Args:
             output_file: Output file path
+            compression: gzip compression level (0-9); 0 writes plain XML
         """
-        super().write_feed(output_file)
+        super().write_feed(output_file, compression=compression)
         print(f"✓ Enriched feed written to: {output_file}")
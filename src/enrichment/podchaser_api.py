@@ -3,59 +3,258 @@ Podchaser API Integration
 Fetches person/creator information from Podchaser.
 """
 
+import hashlib
+import json
 import os
 import sys
+import time
+from collections import Counter
+from pathlib import Path
 
 import requests
 from typing import List, Dict, Optional
 
+# Where access tokens are kept between runs (they are valid for a long time)
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "podchaser_token.json"
+
+# Treat a cached token as expired this many seconds early
+_TOKEN_EXPIRY_MARGIN = 60
+
+# Where podcast search/credit responses are cached when response_cache_ttl is set
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "podchaser"
+
+# GraphQL documents; per-call values are always passed as variables
+_ACCESS_TOKEN_MUTATION = """
+mutation RequestAccessToken($clientId: String!, $clientSecret: String!) {
+    requestAccessToken(
+        input: {
+            grant_type: CLIENT_CREDENTIALS
+            client_id: $clientId
+            client_secret: $clientSecret
+        }
+    ) {
+        access_token
+        token_type
+        expires_in
+    }
+}
+"""
+
+_SEARCH_PODCAST_QUERY = """
+query SearchPodcast($searchTerm: String!) {
+  podcasts(searchTerm: $searchTerm, first: 1) {
+    paginatorInfo {
+      currentPage
+      hasMorePages
+    }
+    data {
+      id
+      title
+      description
+      imageUrl
+      webUrl
+    }
+  }
+}
+"""
+
+_PODCAST_CREATORS_QUERY = """
+query GetPodcastCreators($podcastId: String!) {
+  podcast(identifier: {type: PODCHASER, id: $podcastId}) {
+    id
+    title
+    episodes(first: 10) {
+      data {
+        id
+        title
+        credits {
+          data {
+            creator {
+              name
+              imageUrl
+            }
+            role {
+              code
+              title
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_SEARCH_PODCAST_WITH_CREDITS_QUERY = """
+query SearchPodcastWithCredits($searchTerm: String!) {
+  podcasts(searchTerm: $searchTerm, first: 1) {
+    data {
+      id
+      title
+      episodes(first: 10) {
+        data {
+          id
+          title
+          credits {
+            data {
+              creator {
+                name
+                imageUrl
+              }
+              role {
+                code
+                title
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+_SEARCH_CREATOR_QUERY = """
+query SearchCreator($searchTerm: String!, $first: Int!) {
+  creators(searchTerm: $searchTerm, first: $first) {
+    data {
+      name
+      imageUrl
+      url
+    }
+  }
+}
+"""
+
+_SEARCH_EPISODE_QUERY = """
+query SearchEpisode($podcastId: String!, $searchTerm: String!, $first: Int!) {
+  podcast(identifier: { type: PODCHASER, id: $podcastId }) {
+    title
+    episodes(searchTerm: $searchTerm, first: $first) {
+      data {
+        id
+        title
+        url
+      }
+    }
+  }
+}
+"""
+
+_EPISODE_CREDITS_QUERY = """
+query GetEpisodeCredits($episodeId: String!) {
+  episode(identifier: { type: PODCHASER, id: $episodeId }) {
+    title
+    credits(first: 100) {
+      data {
+        role {
+          title
+        }
+        creator {
+          name
+          imageUrl
+          url
+        }
+      }
+    }
+  }
+}
+"""
+
 
 class PodchaserAPI:
     """Client for interacting with Podchaser API."""
 
     BASE_URL = "https://api.podchaser.com/graphql"
 
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 token_cache_path: Optional[Path] = TOKEN_CACHE_PATH,
+                 response_cache_ttl: int = 0,
+                 response_cache_dir: Path = RESPONSE_CACHE_DIR):
         """
         Initialize Podchaser API client.
 
         Args:
             api_key: Podchaser API key (client_id)
             api_secret: Podchaser API secret (client_secret)
+            token_cache_path: File to reuse access tokens from across runs
+                (None disables the cache)
+            response_cache_ttl: Seconds to reuse podcast search/credit responses
+                from disk (0 disables the cache)
+            response_cache_dir: Directory for cached responses
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self.token_cache_path = token_cache_path
+        self.response_cache_ttl = response_cache_ttl
+        self.response_cache_dir = response_cache_dir
         self.access_token = None
         self.headers = {
             "Content-Type": "application/json",
         }
+        # One pooled connection for every call, so only the first pays the TLS handshake
+        self.session = requests.Session()
 
-        # If credentials provided, get access token
-        if api_key and api_secret:
+        # If credentials provided, reuse a cached access token or request a new one
+        if api_key and api_secret and not self._load_cached_token():
             self._get_access_token()
 
+    def _load_cached_token(self) -> bool:
+        """
+        Use the cached access token if it belongs to this client and hasn't expired.
+
+        Returns:
+            True if a cached token was loaded
+        """
+        if self.token_cache_path is None:
+            return False
+
+        try:
+            with open(self.token_cache_path, 'rb') as f:
+                cached = json.loads(f.read())
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(cached, dict) or cached.get("client_id") != self.api_key:
+            return False
+        access_token = cached.get("access_token")
+        expires_at = cached.get("expires_at")
+        if not access_token or not isinstance(expires_at, (int, float)):
+            return False
+        if time.time() >= expires_at - _TOKEN_EXPIRY_MARGIN:
+            return False
+
+        self.access_token = access_token
+        self.headers["Authorization"] = f"Bearer {self.access_token}"
+        print("✓ Using cached Podchaser access token")
+        return True
+
+    def _save_cached_token(self, expires_in: Optional[int]) -> None:
+        """Store the current access token with its expiry time (owner-readable only)."""
+        if self.token_cache_path is None or not expires_in:
+            return
+
+        payload = json.dumps({
+            "client_id": self.api_key,
+            "access_token": self.access_token,
+            "expires_at": time.time() + int(expires_in),
+        })
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+        except OSError as e:
+            print(f"⚠ Could not cache Podchaser access token: {e}")
+
     def _get_access_token(self) -> None:
         """Get OAuth access token using client credentials."""
-        mutation = """
-        mutation {
-            requestAccessToken(
-                input: {
-                    grant_type: CLIENT_CREDENTIALS
-                    client_id: "%s"
-                    client_secret: "%s"
-                }
-            ) {
-                access_token
-                token_type
-                expires_in
-            }
-        }
-        """ % (self.api_key, self.api_secret)
+        variables = {"clientId": self.api_key, "clientSecret": self.api_secret}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.BASE_URL,
-                json={"query": mutation},
+                json={"query": _ACCESS_TOKEN_MUTATION, "variables": variables},
                 headers={"Content-Type": "application/json"},
                 timeout=10
             )
@@ -72,12 +271,54 @@ class PodchaserAPI:
             if self.access_token:
                 self.headers["Authorization"] = f"Bearer {self.access_token}"
                 print("✓ Successfully authenticated with Podchaser API")
+                self._save_cached_token(token_data.get("expires_in"))
             else:
                 print("⚠ No access token received")
 
         except requests.RequestException as e:
             print(f"Error requesting access token: {e}")
 
+    def _post_cached(self, query: str, variables: Dict) -> Dict:
+        """
+        POST a query and return the decoded response, reusing a cached copy if fresh.
+
+        Responses are stored under a hash of the query and its variables. Error
+        responses are never cached. With response_cache_ttl at 0 this is a plain POST.
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        cache_file = None
+        if self.response_cache_ttl > 0:
+            key = hashlib.sha1(
+                json.dumps([query, variables], sort_keys=True).encode('utf-8')
+            ).hexdigest()
+            cache_file = self.response_cache_dir / f"{key}.json"
+            try:
+                if time.time() - cache_file.stat().st_mtime < self.response_cache_ttl:
+                    with open(cache_file, 'rb') as f:
+                        return json.loads(f.read())
+            except (OSError, ValueError):
+                pass
+
+        response = self.session.post(
+            self.BASE_URL,
+            json={"query": query, "variables": variables},
+            headers=self.headers,
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if cache_file is not None and "errors" not in data:
+            try:
+                self.response_cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(data), encoding='utf-8')
+            except OSError as e:
+                print(f"⚠ Could not cache Podchaser response: {e}")
+
+        return data
+
     def search_podcast(self, podcast_name: str) -> Optional[Dict]:
         """
         Search for a podcast by name.
@@ -88,35 +329,10 @@ class PodchaserAPI:
         Returns:
             Podcast information or None if not found
         """
-        query = """
-        query SearchPodcast($searchTerm: String!) {
-          podcasts(searchTerm: $searchTerm, first: 1) {
-            paginatorInfo {
-              currentPage
-              hasMorePages
-            }
-            data {
-              id
-              title
-              description
-              imageUrl
-              webUrl
-            }
-          }
-        }
-        """
-
         variables = {"searchTerm": podcast_name}
 
         try:
-            response = requests.post(
-                self.BASE_URL,
-                json={"query": query, "variables": variables},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_cached(_SEARCH_PODCAST_QUERY, variables)
 
             # Debug: print response
             if "errors" in data:
@@ -154,44 +370,10 @@ class PodchaserAPI:
         Returns:
             List of creator information dicts
         """
-        query = """
-        query GetPodcastCreators($podcastId: String!) {
-          podcast(identifier: {type: PODCHASER, id: $podcastId}) {
-            id
-            title
-            episodes(first: 10) {
-              data {
-                id
-                title
-                credits {
-                  data {
-                    creator {
-                      name
-                      imageUrl
-                    }
-                    role {
-                      code
-                      title
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-
         variables = {"podcastId": podcast_id}
 
         try:
-            response = requests.post(
-                self.BASE_URL,
-                json={"query": query, "variables": variables},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._post_cached(_PODCAST_CREATORS_QUERY, variables)
 
             # Debug
             if "errors" in data:
@@ -199,50 +381,93 @@ class PodchaserAPI:
                 return []
 
             episodes = data.get("data", {}).get("podcast", {}).get("episodes", {}).get("data", [])
-            print(f"  Analyzing {len(episodes)} episodes to find hosts...")
-
-            # Aggregate hosts across episodes
-            host_counts = {}  # {name: {"count": N, "imageUrl": "...", "role_code": "..."}}
-
-            for episode in episodes:
-                credits = episode.get("credits", {}).get("data", [])
-                for credit in credits:
-                    creator = credit.get("creator", {})
-                    role = credit.get("role", {})
-                    role_code = role.get("code", "")
-
-                    # Only count people with "host" role (not guestHost)
-                    if role_code == "host":
-                        name = creator.get("name", "")
-                        if name:
-                            if name not in host_counts:
-                                host_counts[name] = {
-                                    "count": 0,
-                                    "imageUrl": creator.get("imageUrl", ""),
-                                    "role_code": role_code
-                                }
-                            host_counts[name]["count"] += 1
-
-            # Convert to podcast:person format
-            persons = []
-            for name, info in host_counts.items():
-                print(f"    - {name}: appears as host in {info['count']} episode(s)")
-                persons.append({
-                    "name": name,
-                    "role": "host",
-                    "href": "",  # No direct URL in this API response
-                    "img": info["imageUrl"] if info["imageUrl"] else ""
-                })
-
-            if not persons:
-                print("  ⚠ No hosts found in episode credits")
-
-            return persons
+            return self._hosts_from_episodes(episodes)
 
         except requests.RequestException as e:
             print(f"Error fetching creators from Podchaser: {e}")
             return []
 
+    def _hosts_from_episodes(self, episodes: List[Dict]) -> List[Dict[str, str]]:
+        """
+        Collect the people credited with the "host" role across episodes.
+
+        Args:
+            episodes: Episode dicts with a credits.data list, as returned by the API
+
+        Returns:
+            List of podcast:person dicts, in order of first appearance
+        """
+        print(f"  Analyzing {len(episodes)} episodes to find hosts...")
+
+        # Aggregate hosts across episodes (first image seen per host wins)
+        host_counts = Counter()
+        host_images = {}
+
+        for episode in episodes:
+            for credit in episode.get("credits", {}).get("data", []):
+                # Only count people with "host" role (not guestHost)
+                if credit.get("role", {}).get("code", "") != "host":
+                    continue
+                creator = credit.get("creator", {})
+                name = creator.get("name", "")
+                if name:
+                    if name not in host_counts:
+                        host_images[name] = creator.get("imageUrl", "")
+                    host_counts[name] += 1
+
+        for name, count in host_counts.items():
+            print(f"    - {name}: appears as host in {count} episode(s)")
+
+        # Convert to podcast:person format
+        persons = [
+            {
+                "name": name,
+                "role": "host",
+                "href": "",  # No direct URL in this API response
+                "img": host_images[name] or ""
+            }
+            for name in host_counts
+        ]
+
+        if not persons:
+            print("  ⚠ No hosts found in episode credits")
+
+        return persons
+
+    def _search_podcast_with_episodes(self, podcast_name: str) -> Optional[Dict]:
+        """
+        Search for a podcast and fetch its recent episode credits in one request.
+
+        Combines the search_podcast() and get_podcast_creators() queries, so the
+        result has the podcast fields plus episodes.data[].credits.
+
+        Args:
+            podcast_name: Name of the podcast to search for
+
+        Returns:
+            Podcast information or None if not found
+        """
+        variables = {"searchTerm": podcast_name}
+
+        try:
+            data = self._post_cached(_SEARCH_PODCAST_WITH_CREDITS_QUERY, variables)
+
+            if "errors" in data:
+                print(f"Podchaser API errors: {data['errors']}")
+                return None
+
+            podcasts = data.get("data", {}).get("podcasts", {}).get("data", [])
+
+            if not podcasts:
+                print(f"No podcasts found for search term: '{podcast_name}'")
+                print(f"Try searching on https://www.podchaser.com/ first")
+
+            return podcasts[0] if podcasts else None
+
+        except requests.RequestException as e:
+            print(f"Error searching Podchaser: {e}")
+            return None
+
     def enrich_feed_with_creators(self, podcast_name: str) -> List[Dict[str, str]]:
         """
         Convenience method to search for a podcast and get its creators.
@@ -254,7 +479,7 @@ class PodchaserAPI:
             List of creator information
         """
         print(f"Searching for podcast: '{podcast_name}'")
-        podcast = self.search_podcast(podcast_name)
+        podcast = self._search_podcast_with_episodes(podcast_name)
 
         if not podcast:
             print(f"⚠ Podcast '{podcast_name}' not found on Podchaser")
@@ -262,10 +487,10 @@ class PodchaserAPI:
             return []
 
         print(f"✓ Found podcast: {podcast.get('title')} (ID: {podcast.get('id')})")
-        podcast_id = podcast["id"]
 
-        print(f"Fetching credits for podcast...")
-        creators = self.get_podcast_creators(podcast_id)
+        # Credits came back with the search, so no second request is needed
+        episodes = (podcast.get("episodes") or {}).get("data", [])
+        creators = self._hosts_from_episodes(episodes)
 
         if not creators:
             print(f"⚠ No credits found for this podcast")
@@ -278,21 +503,11 @@ class PodchaserAPI:
 
         Returns a list of dicts with ``name``, ``imageUrl`` and ``url`` keys.
         """
-        query = '''
-        query {
-          creators(searchTerm: "%s", first: %d) {
-            data {
-              name
-              imageUrl
-              url
-            }
-          }
-        }
-        ''' % (name, first)
+        variables = {"searchTerm": name, "first": first}
 
-        response = requests.post(
+        response = self.session.post(
             self.BASE_URL,
-            json={"query": query},
+            json={"query": _SEARCH_CREATOR_QUERY, "variables": variables},
             headers=self.headers,
             timeout=15,
         )
@@ -318,24 +533,11 @@ class PodchaserAPI:
         Returns the best match (exact-match preferred, otherwise first result),
         or None.
         """
-        query = '''
-        query {
-          podcast(identifier: { type: PODCHASER, id: "%s" }) {
-            title
-            episodes(searchTerm: "%s", first: %d) {
-              data {
-                id
-                title
-                url
-              }
-            }
-          }
-        }
-        ''' % (podcast_id, episode_title, first)
+        variables = {"podcastId": podcast_id, "searchTerm": episode_title, "first": first}
 
-        response = requests.post(
+        response = self.session.post(
             self.BASE_URL,
-            json={"query": query},
+            json={"query": _SEARCH_EPISODE_QUERY, "variables": variables},
             headers=self.headers,
             timeout=15,
         )
@@ -364,29 +566,11 @@ class PodchaserAPI:
 
     def fetch_episode_credits(self, episode_id: str) -> List[Dict]:
         """Return the credits list for a Podchaser episode id."""
-        query = '''
-        query {
-          episode(identifier: { type: PODCHASER, id: "%s" }) {
-            title
-            credits(first: 100) {
-              data {
-                role {
-                  title
-                }
-                creator {
-                  name
-                  imageUrl
-                  url
-                }
-              }
-            }
-          }
-        }
-        ''' % episode_id
+        variables = {"episodeId": episode_id}
 
-        response = requests.post(
+        response = self.session.post(
             self.BASE_URL,
-            json={"query": query},
+            json={"query": _EPISODE_CREDITS_QUERY, "variables": variables},
             headers=self.headers,
             timeout=15,
         )
@@ -427,7 +611,7 @@ class PodchaserAPI:
         errors list (or None).
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.BASE_URL + "/cost",
                 json={"query": query, "variables": variables or {}},
                 headers=self.headers,
@@ -48,6 +48,17 @@ def _q(ns: str, tag: str) -> str:
     return f"{{{ns}}}{tag}"
 
 
+# Qualified tag names used for every item, built once instead of per episode
+_ITUNES_AUTHOR = _q(ITUNES, "author")
+_ITUNES_IMAGE = _q(ITUNES, "image")
+_ITUNES_DURATION = _q(ITUNES, "duration")
+_ITUNES_EXPLICIT = _q(ITUNES, "explicit")
+_ITUNES_EPISODE_TYPE = _q(ITUNES, "episodeType")
+_ITUNES_SEASON = _q(ITUNES, "season")
+_ITUNES_EPISODE = _q(ITUNES, "episode")
+_PODCAST_SEASON = _q(PODCAST, "season")
+
+
 def _text(parent: etree._Element, tag: str, value) -> Optional[etree._Element]:
     """Append a child element with text, or do nothing when value is falsy."""
     if value is None or value == "":
@@ -193,27 +204,27 @@ def _build_item(channel: etree._Element, ep: Dict, season_no: int,
 
     # Surface which podcast the episode actually comes from (cross-podcast list).
     podcast = ep.get("podcast") or {}
-    _text(item, _q(ITUNES, "author"), podcast.get("title"))
+    _text(item, _ITUNES_AUTHOR, podcast.get("title"))
 
     ep_image = ep.get("imageUrl") or podcast.get("imageUrl") or channel_image
     if ep_image:
-        etree.SubElement(item, _q(ITUNES, "image")).set("href", ep_image)
+        etree.SubElement(item, _ITUNES_IMAGE).set("href", ep_image)
 
-    _text(item, _q(ITUNES, "duration"), _duration(ep.get("length")))
-    _text(item, _q(ITUNES, "explicit"), "true" if ep.get("explicit") else "false")
+    _text(item, _ITUNES_DURATION, _duration(ep.get("length")))
+    _text(item, _ITUNES_EXPLICIT, "true" if ep.get("explicit") else "false")
     # Normalize to "full": bonus/trailer status was relative to the source
     # podcast; in this curated list every entry is a first-class episode.
-    _text(item, _q(ITUNES, "episodeType"), "full")
+    _text(item, _ITUNES_EPISODE_TYPE, "full")
 
     # Per-edition feeds are flat (a single edition) — season tags only make
     # sense in the combined feed where each edition is a distinct season.
     if include_season:
-        season = etree.SubElement(item, _q(PODCAST, "season"))
+        season = etree.SubElement(item, _PODCAST_SEASON)
         if season_name:
             season.set("name", season_name)
         season.text = str(season_no)
-        _text(item, _q(ITUNES, "season"), str(season_no))
-    _text(item, _q(ITUNES, "episode"), str(ep_no))
+        _text(item, _ITUNES_SEASON, str(season_no))
+    _text(item, _ITUNES_EPISODE, str(ep_no))
 
 
 def build_feed(*, title: str, description: Optional[str], language: str,
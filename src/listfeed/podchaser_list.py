@@ -15,8 +15,6 @@ search term / slug.
 import sys
 from typing import Dict, List, Optional
 
-import requests
-
 from src.enrichment.podchaser_api import PodchaserAPI
 
 # Episode fields needed to build a complete, playable RSS item. audioUrl is the
@@ -78,7 +76,7 @@ query FindList($term: String!) {
 
 def _post(api: PodchaserAPI, query: str, variables: Dict) -> Dict:
     """POST a query to the real endpoint, logging point cost, returning JSON data."""
-    response = requests.post(
+    response = api.session.post(
         api.BASE_URL,
         json={"query": query, "variables": variables},
         headers=api.headers,